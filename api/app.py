@@ -1,17 +1,21 @@
 """
 FastAPI application for LoFi IA YouTube automated video generation.
 """
+import asyncio
+import time
 from datetime import datetime
-from typing import List
-from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import JSONResponse
+from typing import List, Optional
+from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from fastapi.exceptions import RequestValidationError
-from sqlalchemy import text
+from sqlalchemy import Integer, bindparam, text
 from sqlalchemy.exc import SQLAlchemyError
-import redis
+from sqlalchemy.ext.asyncio import AsyncSession
+from redis import asyncio as aioredis
 
 from tasks import generate_and_publish
-from db import SessionLocal
+from db import get_async_db
 from models import Event
 from schemas import (
     HealthResponse,
@@ -31,6 +35,7 @@ app = FastAPI(
     description="Automated Lo-Fi video generation and YouTube publishing pipeline",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Add middleware (order matters - first added is executed last)
@@ -38,6 +43,47 @@ app.add_middleware(CORSSecurityMiddleware, allowed_origins=["*"])
 app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(RateLimitMiddleware, redis_url=REDIS_URL, requests_per_minute=60)
 
+# Long-lived Redis client for health probes (built lazily, reset on failure)
+_health_redis = None
+
+# Backends are probed at most once per interval; results are cached in between
+HEALTH_CHECK_INTERVAL = 10.0
+HEALTH_PROBE_TIMEOUT = 2.0
+_last_db_check_ts = float("-inf")
+_last_db_ok = False
+_last_ping_ts = float("-inf")
+_last_ping_ok = False
+
+# Statements built once so SQLAlchemy's compiled cache is hit on every request
+_HEALTH_DB_QUERY = text("SELECT 1")
+_EVENTS_QUERY = text(
+    "SELECT id, created_at, kind, status FROM events ORDER BY id DESC LIMIT :lim"
+).bindparams(bindparam("lim", type_=Integer))
+_EVENTS_AFTER_QUERY = text(
+    "SELECT id, created_at, kind, status FROM events WHERE id < :after_id ORDER BY id DESC LIMIT :lim"
+).bindparams(bindparam("after_id", type_=Integer), bindparam("lim", type_=Integer))
+
+
+def get_health_redis() -> aioredis.Redis:
+    """
+    Get the shared Redis client used by the health check.
+
+    The client is created on first use and reused across probes so that each
+    check does not pay a new TCP connection and AUTH round-trip.
+
+    Returns:
+        Redis client instance
+    """
+    global _health_redis
+    if _health_redis is None:
+        _health_redis = aioredis.from_url(
+            REDIS_URL,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+            health_check_interval=30,
+        )
+    return _health_redis
+
 
 # Exception handlers
 @app.exception_handler(RequestValidationError)
@@ -50,12 +96,12 @@ async def validation_exception_handler(request, exc):
         path=str(request.url),
         errors=str(exc.errors()),
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content={
             "detail": "Validation error",
-            "errors": exc.errors(),
-            "timestamp": datetime.utcnow().isoformat(),
+            "errors": jsonable_encoder(exc.errors()),
+            "timestamp": datetime.utcnow(),
         },
     )
 
@@ -70,11 +116,11 @@ async def general_exception_handler(request, exc):
         path=str(request.url),
         error=str(exc),
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
         },
     )
 
@@ -86,7 +132,7 @@ async def general_exception_handler(request, exc):
     description="Check the health status of the API and its dependencies (database, Redis)",
     tags=["System"],
 )
-def health():
+async def health(db: AsyncSession = Depends(get_async_db)):
     """
     Perform comprehensive health check.
 
@@ -94,39 +140,55 @@ def health():
     - PostgreSQL database
     - Redis message broker
 
+    Each backend is probed at most once every HEALTH_CHECK_INTERVAL seconds;
+    calls in between report the last observed status. Probes run concurrently
+    and each one is bounded by HEALTH_PROBE_TIMEOUT seconds.
+
     Returns:
         HealthResponse with status of each component
     """
+    global _health_redis, _last_db_check_ts, _last_db_ok, _last_ping_ts, _last_ping_ok
+    now = time.monotonic()
+
+    # Probe stale backends concurrently, each bounded by HEALTH_PROBE_TIMEOUT
+    probes = {}
+    if now - _last_db_check_ts >= HEALTH_CHECK_INTERVAL:
+        probes["database"] = asyncio.wait_for(db.execute(_HEALTH_DB_QUERY), HEALTH_PROBE_TIMEOUT)
+    if now - _last_ping_ts >= HEALTH_CHECK_INTERVAL:
+        probes["redis"] = asyncio.wait_for(get_health_redis().ping(), HEALTH_PROBE_TIMEOUT)
+    results = dict(zip(probes, await asyncio.gather(*probes.values(), return_exceptions=True)))
+
+    if "database" in results:
+        error = results["database"]
+        _last_db_ok = not isinstance(error, Exception)
+        _last_db_check_ts = now
+        if _last_db_ok:
+            app_logger.info("Database health check passed")
+        else:
+            log_with_context(
+                app_logger, "error", "Database health check failed", error=str(error) or type(error).__name__
+            )
+
+    if "redis" in results:
+        error = results["redis"]
+        _last_ping_ok = not isinstance(error, Exception)
+        _last_ping_ts = now
+        if _last_ping_ok:
+            app_logger.info("Redis health check passed")
+        else:
+            # Drop the cached client so the next probe reconnects
+            _health_redis = None
+            log_with_context(
+                app_logger, "error", "Redis health check failed", error=str(error) or type(error).__name__
+            )
+
     health_status = {
-        "status": "ok",
-        "database": "unknown",
-        "redis": "unknown",
+        "status": "ok" if _last_db_ok and _last_ping_ok else "degraded",
+        "database": "ok" if _last_db_ok else "error",
+        "redis": "ok" if _last_ping_ok else "error",
         "timestamp": datetime.utcnow(),
     }
 
-    # Check database
-    try:
-        db = SessionLocal()
-        db.execute(text("SELECT 1"))
-        db.close()
-        health_status["database"] = "ok"
-        app_logger.info("Database health check passed")
-    except SQLAlchemyError as e:
-        health_status["database"] = "error"
-        health_status["status"] = "degraded"
-        log_with_context(app_logger, "error", "Database health check failed", error=str(e))
-
-    # Check Redis
-    try:
-        r = redis.from_url(REDIS_URL, socket_connect_timeout=2)
-        r.ping()
-        health_status["redis"] = "ok"
-        app_logger.info("Redis health check passed")
-    except Exception as e:
-        health_status["redis"] = "error"
-        health_status["status"] = "degraded"
-        log_with_context(app_logger, "error", "Redis health check failed", error=str(e))
-
     return health_status
 
 
@@ -182,19 +244,28 @@ def run_pipeline():
     description="Retrieve recent pipeline execution events",
     tags=["Monitoring"],
 )
-def list_events(
+async def list_events(
     limit: int = Query(
         50,
         ge=1,
         le=1000,
         description="Maximum number of events to return",
-    )
+    ),
+    after_id: Optional[int] = Query(
+        None,
+        ge=1,
+        description="Only return events older than this event ID (keyset pagination)",
+    ),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     List recent events from the database.
 
     Args:
         limit: Maximum number of events to return (1-1000)
+        after_id: Cursor from a previous page; pass the last ID received to
+            fetch the next (older) page
+        db: Database session (injected)
 
     Returns:
         List of event records ordered by creation date (newest first)
@@ -203,24 +274,22 @@ def list_events(
         HTTPException: If database query fails
     """
     try:
-        db = SessionLocal()
-        rows = db.execute(
-            text("SELECT id, created_at, kind, status FROM events ORDER BY id DESC LIMIT :lim"),
-            {"lim": limit},
-        ).fetchall()
-        db.close()
-
-        events = [dict(r._mapping) for r in rows]
+        if after_id is None:
+            result = await db.execute(_EVENTS_QUERY, {"lim": limit})
+        else:
+            result = await db.execute(_EVENTS_AFTER_QUERY, {"after_id": after_id, "lim": limit})
+        events = result.mappings().all()
         log_with_context(
             app_logger,
             "info",
             "Events retrieved",
             count=len(events),
             limit=limit,
+            after_id=after_id,
         )
         return events
 
-    except SQLAlchemyError as e:
+    except (SQLAlchemyError, OSError) as e:
         log_with_context(
             app_logger,
             "error",
@@ -235,9 +304,10 @@ def list_events(
     summary="Prometheus Metrics",
     description="Prometheus metrics endpoint for monitoring",
     tags=["Monitoring"],
+    response_class=PlainTextResponse,
     include_in_schema=False,  # Hide from OpenAPI docs
 )
-def metrics():
+async def metrics():
     """
     Expose Prometheus metrics.
 
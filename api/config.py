@@ -4,9 +4,9 @@ Configuration management with Pydantic validation.
 This module provides a validated configuration system using Pydantic BaseSettings.
 All environment variables are validated at startup with clear error messages.
 """
-import os
-from typing import List, Optional
-from pydantic import Field, field_validator
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -59,6 +59,10 @@ class Settings(BaseSettings):
         default="redis://redis:6379/0",
         description="Redis connection URL"
     )
+    db_behind_pgbouncer: bool = Field(
+        default=False,
+        description="DATABASE_URL targets PgBouncer in transaction mode (it owns pooling)"
+    )
 
     # Storage paths
     media_root: str = Field(
@@ -81,6 +85,10 @@ class Settings(BaseSettings):
         default="/app/static/outro.mp4",
         description="Path to outro video"
     )
+    video_encoder: str = Field(
+        default="auto",
+        description="H.264 encoder (auto, libx264, h264_nvenc, h264_vaapi, h264_videotoolbox)"
+    )
 
     # Default video metadata
     default_title: str = Field(
@@ -140,6 +148,9 @@ class Settings(BaseSettings):
         description="Enable debug mode"
     )
 
+    # Parsed form of default_tags, computed once after validation
+    _default_tags_list: Tuple[str, ...] = PrivateAttr(default=())
+
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
@@ -160,6 +171,24 @@ class Settings(BaseSettings):
             raise ValueError(f"Invalid environment. Must be one of: {', '.join(valid_envs)}")
         return v_lower
 
+    @field_validator("video_encoder")
+    @classmethod
+    def validate_video_encoder(cls, v: str) -> str:
+        """Validate video encoder is a supported choice."""
+        valid_encoders = ["auto", "libx264", "h264_nvenc", "h264_vaapi", "h264_videotoolbox"]
+        v_lower = v.lower()
+        if v_lower not in valid_encoders:
+            raise ValueError(f"Invalid video encoder. Must be one of: {', '.join(valid_encoders)}")
+        return v_lower
+
+    @model_validator(mode="after")
+    def parse_default_tags(self) -> "Settings":
+        """Split default_tags once so get_tags_list() does not re-parse it."""
+        self._default_tags_list = tuple(
+            tag.strip() for tag in self.default_tags.split(",") if tag.strip()
+        )
+        return self
+
     def get_tags_list(self) -> List[str]:
         """
         Get tags as a list.
@@ -167,7 +196,7 @@ class Settings(BaseSettings):
         Returns:
             List of tags
         """
-        return [tag.strip() for tag in self.default_tags.split(",") if tag.strip()]
+        return list(self._default_tags_list)
 
     def is_production(self) -> bool:
         """
@@ -196,15 +225,19 @@ class Settings(BaseSettings):
         env_prefix = ""
 
 
-# Global settings instance
-settings = Settings()
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get application settings.
 
+    The environment is parsed and validated once; subsequent calls (including
+    FastAPI ``Depends(get_settings)``) reuse the cached instance.
+
     Returns:
         Settings instance
     """
-    return settings
+    return Settings()
+
+
+# Global settings instance (kept for backward compatibility)
+settings = get_settings()
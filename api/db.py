@@ -1,14 +1,146 @@
-from sqlalchemy import create_engine, text
+import atexit
+import os
+import queue
+import threading
+import time
+import orjson
+from psycopg2.extras import Json, execute_values
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from settings import DATABASE_URL
+from config import get_settings
+from logger import app_logger, log_with_context
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+if get_settings().db_behind_pgbouncer:
+    # PgBouncer keeps the server connections; holding a second pool here only pins them
+    _sync_pool_options = _async_pool_options = {"poolclass": NullPool}
+    # Transaction pooling cannot keep per-connection prepared statements
+    _async_connect_args = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+else:
+    # No pre-ping (a SELECT 1 round-trip per checkout); recycling bounds connection age instead
+    _common = {"pool_pre_ping": False, "pool_recycle": 300}
+    # The sync engine only serves the event writer (flusher thread + shutdown flush);
+    # API request reads go through the async engine, which gets the larger pool
+    _sync_pool_options = {"pool_size": 2, "max_overflow": 1, **_common}
+    _async_pool_options = {"pool_size": 20, "max_overflow": 10, **_common}
+    _async_connect_args = {}
+
+engine = create_engine(DATABASE_URL, **_sync_pool_options)
 SessionLocal = sessionmaker(bind=engine)
 
-def log_event(db, kind: str, payload: dict, status: str = "ok"):
-    import json
-    db.execute(
-        text("INSERT INTO events(kind, payload, status) VALUES (:k, :p::jsonb, :s)"),
-        {"k": kind, "p": json.dumps(payload), "s": status},
-    )
-    db.commit()
+# Async engine used by the API event loop; Celery tasks keep the sync engine above
+async_engine = create_async_engine(
+    make_url(DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    connect_args=_async_connect_args,
+    **_async_pool_options,
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+def get_db():
+    """FastAPI dependency yielding a session that is always returned to the pool."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    """FastAPI dependency yielding an async session bound to the API event loop."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def _dumps_payload(payload) -> str:
+    # Non-string keys (ints, ...) are stringified, as json.dumps used to do
+    return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+# log_event() only enqueues; a background thread writes events in batches so
+# callers never wait on an INSERT + COMMIT round-trip
+EVENT_FLUSH_INTERVAL = 0.5  # seconds
+EVENT_BATCH_SIZE = 500
+_event_queue: "queue.Queue[tuple]" = queue.Queue()
+# One multi-row statement per batch: Postgres parses/plans once per flush, not per event
+INSERT_EVENTS_SQL = "INSERT INTO events(kind, payload, status) VALUES %s"
+_flush_lock = threading.Lock()
+_flush_thread = None
+_flush_pid = None
+
+def _insert_rows(raw, rows: list) -> None:
+    with raw.cursor() as cur:
+        execute_values(cur, INSERT_EVENTS_SQL, rows, page_size=EVENT_BATCH_SIZE)
+    raw.commit()
+
+def _write_events(batch: list) -> None:
+    try:
+        raw = engine.raw_connection()
+        try:
+            try:
+                _insert_rows(raw, batch)
+                return
+            except Exception as e:
+                if len(batch) == 1:
+                    raise
+                raw.rollback()
+                log_with_context(app_logger, "warning", "Batch insert failed, retrying events one by one",
+                                 count=len(batch), error=str(e))
+            # One bad row must not drop the rest of the batch
+            for row in batch:
+                try:
+                    _insert_rows(raw, [row])
+                except Exception as e:
+                    raw.rollback()
+                    log_with_context(app_logger, "error", "Failed to write event", kind=row[0], error=str(e))
+        finally:
+            raw.close()
+    except Exception as e:
+        log_with_context(app_logger, "error", "Failed to write events", count=len(batch), error=str(e))
+
+def _flush_loop() -> None:
+    while True:
+        batch = [_event_queue.get()]
+        deadline = time.monotonic() + EVENT_FLUSH_INTERVAL
+        while len(batch) < EVENT_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(_event_queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        _write_events(batch)
+
+def _ensure_flush_thread() -> None:
+    # Started lazily and per process, since threads do not survive Celery's fork
+    global _flush_thread, _flush_pid
+    with _flush_lock:
+        if _flush_thread is None or _flush_pid != os.getpid() or not _flush_thread.is_alive():
+            _flush_thread = threading.Thread(target=_flush_loop, name="event-flusher", daemon=True)
+            _flush_thread.start()
+            _flush_pid = os.getpid()
+
+def flush_events() -> None:
+    """Synchronously write every buffered event (called at process shutdown)."""
+    while True:
+        batch = []
+        while len(batch) < EVENT_BATCH_SIZE:
+            try:
+                batch.append(_event_queue.get_nowait())
+            except queue.Empty:
+                break
+        if not batch:
+            return
+        _write_events(batch)
+
+atexit.register(flush_events)
+
+def log_event(kind: str, payload: dict, status: str = "ok"):
+    """Queue an event row for the background writer; returns immediately."""
+    # Serialize now so an unencodable payload raises here, at its caller, instead
+    # of failing the background batch it would have been written with
+    payload_json = _dumps_payload(payload)
+    _ensure_flush_thread()
+    # Json lets psycopg2 adapt the payload for the JSONB column, no ::jsonb cast
+    # needed; dumps=str passes the already encoded text through unchanged
+    _event_queue.put((kind, Json(payload_json, dumps=str), status))
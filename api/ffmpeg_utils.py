@@ -1,46 +1,169 @@
+import asyncio
+import os
 import subprocess
+import tempfile
+from functools import lru_cache
+from config import get_settings
+
+# Hardware H.264 encoders in order of preference, with their rate-control flags
+HW_ENCODERS = {
+    "h264_nvenc": ["-c:v", "h264_nvenc", "-preset", "p4", "-tune", "ll", "-rc", "vbr", "-cq", "23"],
+    "h264_vaapi": ["-vaapi_device", "/dev/dri/renderD128", "-vf", "format=nv12,hwupload", "-c:v", "h264_vaapi", "-qp", "23"],
+    "h264_videotoolbox": ["-c:v", "h264_videotoolbox", "-q:v", "60"],
+}
+SW_ENCODER = ["-c:v", "libx264"]
+
+def _encoder_works(args: list) -> bool:
+    # Encoders can be compiled in without a usable device, so try a one-frame encode
+    try:
+        res = subprocess.run(["ffmpeg","-v","error","-f","lavfi","-i","color=s=256x256:d=0.1"] + args + ["-frames:v","1","-f","null","-"],
+                             capture_output=True, timeout=15)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return res.returncode == 0
+
+@lru_cache(maxsize=1)
+def video_encoder_args() -> tuple:
+    choice = get_settings().video_encoder
+    if choice == "libx264":
+        return tuple(SW_ENCODER)
+    if choice in HW_ENCODERS:
+        return tuple(HW_ENCODERS[choice])
+    try:
+        listed = subprocess.run(["ffmpeg","-hide_banner","-encoders"], capture_output=True, text=True, timeout=15).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return tuple(SW_ENCODER)
+    for name, args in HW_ENCODERS.items():
+        if f" {name} " in listed and _encoder_works(args):
+            return tuple(args)
+    return tuple(SW_ENCODER)
+
+def _with_encoder(cmd: list, filter_complex: bool = False) -> list:
+    # Replace the "-c:v libx264" pair with the selected encoder flags
+    args = list(video_encoder_args())
+    if filter_complex and "-vf" in args:
+        # -vf cannot be combined with -filter_complex: append the upload to the graph instead
+        i = args.index("-vf")
+        upload = args[i + 1]
+        del args[i:i + 2]
+        fc = cmd.index("-filter_complex") + 1
+        cmd = cmd[:fc] + [cmd[fc].replace("[v]", f",{upload}[v]")] + cmd[fc + 1:]
+    i = cmd.index("libx264") - 1
+    return cmd[:i] + args + cmd[i + 2:]
+
+async def _run_async(cmd: list, capture: bool = False) -> bytes:
+    # Async counterpart of subprocess.run(cmd, check=True[, capture_output=True]); returns stdout
+    pipe = asyncio.subprocess.PIPE if capture else None
+    proc = await asyncio.create_subprocess_exec(*cmd, stdout=pipe, stderr=pipe)
+    out, err = await proc.communicate()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, out, err)
+    return out
+
+def _concat_audio_cmd(list_file: str, out_audio: str) -> list:
+    return ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_file, "-c", "copy", out_audio]
 
 def concat_audio_from_list(list_file: str, out_audio: str = "audio.mp3"):
-    subprocess.run(["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_file, "-c", "copy", out_audio], check=True)
+    subprocess.run(_concat_audio_cmd(list_file, out_audio), check=True)
+    return out_audio
+
+async def concat_audio_from_list_async(list_file: str, out_audio: str = "audio.mp3"):
+    await _run_async(_concat_audio_cmd(list_file, out_audio))
     return out_audio
 
+def _probe_duration_cmd(filepath: str) -> list:
+    return ["ffprobe","-v","error","-show_entries","format=duration","-of","csv=p=0", filepath]
+
+@lru_cache(maxsize=256)
+def _probe_duration(filepath: str, mtime_ns: int, size: int) -> float:
+    res = subprocess.run(_probe_duration_cmd(filepath), capture_output=True, check=True)
+    # float() parses bytes directly and ignores the trailing newline
+    return float(res.stdout)
+
 def probe_duration(filepath: str) -> float:
+    # Cached per file version: a rewritten file changes mtime/size and is probed again
+    st = os.stat(filepath)
+    return _probe_duration(filepath, st.st_mtime_ns, st.st_size)
+
+async def probe_duration_async(filepath: str) -> float:
+    return float(await _run_async(_probe_duration_cmd(filepath), capture=True))
+
+# Stream parameters that must match for segments to be joined with -c copy: profile,
+# level, codec tag and the SPS/PPS extradata (hashed) included, not just the geometry
+VIDEO_STREAM_FIELDS = ("codec_name","codec_tag_string","profile","level","width","height",
+                       "pix_fmt","r_frame_rate","time_base","extradata_hash")
+
+@lru_cache(maxsize=256)
+def _probe_video_stream(filepath: str, mtime_ns: int, size: int) -> tuple:
     res = subprocess.run([
-        "ffprobe","-v","error","-show_entries","format=duration","-of","default=noprint_wrappers=1:nokey=1", filepath
+        "ffprobe","-v","error","-select_streams","v:0","-show_data_hash","sha256",
+        "-show_entries","stream=" + ",".join(VIDEO_STREAM_FIELDS),"-of","default=noprint_wrappers=1", filepath
     ], capture_output=True, text=True, check=True)
-    return float(res.stdout.strip())
+    # key=value lines, in ffprobe's own order: index them by name
+    info = dict(line.split("=", 1) for line in res.stdout.splitlines() if "=" in line)
+    return tuple(info.get(field, "") for field in VIDEO_STREAM_FIELDS)
 
-def loop_video_to_duration(loop_src: str, audio_src: str, output: str, intro: str = None, outro: str = None):
-    import math, os, tempfile
-    dur = probe_duration(audio_src)
+def probe_video_stream(filepath: str) -> tuple:
+    # VIDEO_STREAM_FIELDS values of the first video stream
+    st = os.stat(filepath)
+    return _probe_video_stream(filepath, st.st_mtime_ns, st.st_size)
+
+def _can_stream_copy(*paths) -> bool:
+    # Copying is only safe when every segment is already H.264 with identical stream parameters;
+    # any difference (profile, level, SPS/PPS, ...) falls back to the re-encode path
+    try:
+        streams = {probe_video_stream(p) for p in paths}
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return len(streams) == 1 and next(iter(streams))[0] == "h264"
+
+def _loop_video_commands(loop_src, audio_src, output, intro, outro, dur: float, tmp: str) -> list:
+    # ffmpeg invocations (run in order) for loop_video_to_duration; tmp holds intermediates
     base_cmd = ["ffmpeg","-y","-stream_loop","-1","-i", loop_src, "-t", str(dur), "-i", audio_src, "-shortest",
                 "-c:v","libx264","-c:a","aac", output]
     if not intro and not outro:
-        subprocess.run(base_cmd, check=True)
-        return output
-    # intro/outro concat v:
-    tmp_video_fd, tmp_video = tempfile.mkstemp(suffix=".mp4", prefix="tmp_video_")
-    os.close(tmp_video_fd)
-    concat_video_fd, concat_video = tempfile.mkstemp(suffix=".mp4", prefix="concat_video_")
-    os.close(concat_video_fd)
-    try:
-        subprocess.run(["ffmpeg","-y","-stream_loop","-1","-i", loop_src, "-t", str(dur), "-c:v","libx264","-an", tmp_video], check=True)
-        parts = []
-        if intro: parts += ["-i", intro]
-        parts += ["-i", tmp_video]
-        if outro: parts += ["-i", outro]
-        fc = []
-        n = 0
-        if intro: n += 1
-        n += 1
-        if outro: n += 1
-        fc = ["-filter_complex", f"concat=n={n}:v=1:a=0[v]","-map","[v]"]
-        subprocess.run(["ffmpeg","-y"] + parts + fc + [concat_video], check=True)
-        subprocess.run(["ffmpeg","-y","-i",concat_video,"-i", audio_src,"-shortest","-c:v","libx264","-c:a","aac", output], check=True)
-    finally:
-        # Clean up temporary files
-        if os.path.exists(tmp_video):
-            os.unlink(tmp_video)
-        if os.path.exists(concat_video):
-            os.unlink(concat_video)
+        if _can_stream_copy(loop_src):
+            base_cmd[base_cmd.index("libx264")] = "copy"
+            return [base_cmd]
+        return [_with_encoder(base_cmd)]
+    segments = [p for p in (intro, loop_src, outro) if p]
+    if _can_stream_copy(*segments):
+        # Copy-only chain: mux the loop stretch, then join segments with the concat demuxer
+        loop_tmp = os.path.join(tmp, "loop.mp4")
+        list_file = os.path.join(tmp, "segments.txt")
+        with open(list_file, "w") as f:
+            for p in segments:
+                f.write(f"file '{os.path.abspath(loop_tmp if p == loop_src else p)}'\n")
+        return [
+            ["ffmpeg","-y","-stream_loop","-1","-i", loop_src, "-t", str(dur), "-c:v","copy","-an", loop_tmp],
+            ["ffmpeg","-y","-f","concat","-safe","0","-i", list_file, "-i", audio_src,
+             "-map","0:v","-map","1:a","-shortest","-c:v","copy","-c:a","aac", output],
+        ]
+    # Mismatched segments: loop, concat and audio mux in a single encode pass
+    parts = []
+    if intro: parts += ["-i", intro]
+    parts += ["-stream_loop", "-1", "-t", str(dur), "-i", loop_src]
+    if outro: parts += ["-i", outro]
+    n = (1 if intro else 0) + 1 + (1 if outro else 0)
+    parts += ["-i", audio_src]  # input index n
+    streams = "".join(f"[{i}:v]" for i in range(n))
+    fc = ["-filter_complex", f"{streams}concat=n={n}:v=1:a=0[v]", "-map", "[v]", "-map", f"{n}:a"]
+    cmd = ["ffmpeg","-y"] + parts + fc + ["-shortest","-c:v","libx264","-c:a","aac", output]
+    return [_with_encoder(cmd, filter_complex=True)]
+
+def loop_video_to_duration(loop_src: str, audio_src: str, output: str, intro: str = None, outro: str = None):
+    dur = probe_duration(audio_src)
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(output) or None) as tmp:
+        for cmd in _loop_video_commands(loop_src, audio_src, output, intro, outro, dur, tmp):
+            subprocess.run(cmd, check=True)
+    return output
+
+async def loop_video_to_duration_async(loop_src: str, audio_src: str, output: str, intro: str = None, outro: str = None):
+    # Same pipeline as loop_video_to_duration without blocking the event loop
+    dur = await probe_duration_async(audio_src)
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(output) or None) as tmp:
+        # Stream probes and encoder detection are short blocking calls; keep them off the loop too
+        cmds = await asyncio.to_thread(_loop_video_commands, loop_src, audio_src, output, intro, outro, dur, tmp)
+        for cmd in cmds:
+            await _run_async(cmd)
     return output
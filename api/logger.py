@@ -3,19 +3,34 @@ Structured logging configuration for the application.
 """
 import logging
 import sys
-from datetime import datetime
+import time
 from typing import Any, Dict
 
+import orjson
+
 
 class JSONFormatter(logging.Formatter):
     """
     Custom JSON formatter for structured logging.
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The second-resolution part of the timestamp is formatted once per second
+        self._cached_second = None
+        self._cached_prefix = ""
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        if second != self._cached_second:
+            self._cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._cached_second = second
+        return f"{self._cached_prefix}.{int((created - second) * 1000):03d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON string."""
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -28,8 +43,8 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)
 
-        # Format as simple key=value pairs for readability
-        return " ".join(f"{k}={v}" for k, v in log_data.items())
+        # Context values that orjson cannot serialize natively fall back to str()
+        return orjson.dumps(log_data, default=str).decode()
 
 
 def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
@@ -57,6 +72,15 @@ def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
     return logger
 
 
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
 def log_with_context(logger: logging.Logger, level: str, message: str, **kwargs):
     """
     Log a message with additional context fields.
@@ -67,9 +91,11 @@ def log_with_context(logger: logging.Logger, level: str, message: str, **kwargs)
         message: Log message
         **kwargs: Additional context fields
     """
-    log_method = getattr(logger, level.lower())
-    extra = {"extra_fields": kwargs}
-    log_method(message, extra=extra)
+    level_int = _LEVELS[level.lower()]
+    # Filtered records are dropped before the extra dict is built
+    if not logger.isEnabledFor(level_int):
+        return
+    logger.log(level_int, message, extra={"extra_fields": kwargs})
 
 
 # Default application logger
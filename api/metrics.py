@@ -3,7 +3,7 @@ Prometheus metrics for monitoring the LoFi IA YouTube application.
 """
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
 from fastapi import Response
-from functools import wraps
+from functools import lru_cache, wraps
 import time
 
 
@@ -136,6 +136,33 @@ rate_limit_hits_total = Counter(
 )
 
 
+# Last rendered exposition payload as (monotonic timestamp, bytes)
+METRICS_CACHE_TTL = 1.0
+_metrics_cache = (float("-inf"), b"")
+
+
+# Bound label children are cached so repeated observations skip the
+# label validation, key construction and lock inside .labels()
+@lru_cache(maxsize=1024)
+def _request_counter(method: str, endpoint: str, status_code: int):
+    return http_requests_total.labels(method=method, endpoint=endpoint, status_code=status_code)
+
+
+@lru_cache(maxsize=1024)
+def _request_duration(method: str, endpoint: str):
+    return http_request_duration_seconds.labels(method=method, endpoint=endpoint)
+
+
+@lru_cache(maxsize=128)
+def _pipeline_step_duration(step_name: str):
+    return pipeline_steps_duration_seconds.labels(step_name=step_name)
+
+
+@lru_cache(maxsize=1024)
+def _error_counter(error_type: str, endpoint: str):
+    return errors_total.labels(error_type=error_type, endpoint=endpoint)
+
+
 def track_request_metrics(method: str, endpoint: str, status_code: int, duration: float):
     """
     Track HTTP request metrics.
@@ -146,16 +173,8 @@ def track_request_metrics(method: str, endpoint: str, status_code: int, duration
         status_code: HTTP status code
         duration: Request duration in seconds
     """
-    http_requests_total.labels(
-        method=method,
-        endpoint=endpoint,
-        status_code=status_code
-    ).inc()
-
-    http_request_duration_seconds.labels(
-        method=method,
-        endpoint=endpoint
-    ).observe(duration)
+    _request_counter(method, endpoint, status_code).inc()
+    _request_duration(method, endpoint).observe(duration)
 
 
 def track_pipeline_step(step_name: str, duration: float):
@@ -166,9 +185,7 @@ def track_pipeline_step(step_name: str, duration: float):
         step_name: Name of the pipeline step
         duration: Step duration in seconds
     """
-    pipeline_steps_duration_seconds.labels(
-        step_name=step_name
-    ).observe(duration)
+    _pipeline_step_duration(step_name).observe(duration)
 
 
 def track_error(error_type: str, endpoint: str):
@@ -179,10 +196,7 @@ def track_error(error_type: str, endpoint: str):
         error_type: Type/class of error
         endpoint: Endpoint where error occurred
     """
-    errors_total.labels(
-        error_type=error_type,
-        endpoint=endpoint
-    ).inc()
+    _error_counter(error_type, endpoint).inc()
 
 
 def timer_metric(metric_histogram, labels: dict = None):
@@ -196,19 +210,19 @@ def timer_metric(metric_histogram, labels: dict = None):
     Returns:
         Decorated function
     """
+    # Labels are fixed per decorated function, so bind the child once
+    target = metric_histogram.labels(**labels) if labels else metric_histogram
+
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
                 return result
             finally:
-                duration = time.time() - start_time
-                if labels:
-                    metric_histogram.labels(**labels).observe(duration)
-                else:
-                    metric_histogram.observe(duration)
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
+                target.observe(duration)
         return wrapper
     return decorator
 
@@ -217,10 +231,18 @@ def get_metrics() -> Response:
     """
     Generate Prometheus metrics response.
 
+    The rendered payload is reused for METRICS_CACHE_TTL seconds so that
+    aggressive scraping does not walk every collector on each request.
+
     Returns:
         Response with Prometheus metrics in text format
     """
-    metrics_output = generate_latest()
+    global _metrics_cache
+    now = time.monotonic()
+    rendered_at, metrics_output = _metrics_cache
+    if now - rendered_at >= METRICS_CACHE_TTL:
+        metrics_output = generate_latest()
+        _metrics_cache = (now, metrics_output)
     return Response(
         content=metrics_output,
         media_type=CONTENT_TYPE_LATEST
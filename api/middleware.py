@@ -1,26 +1,60 @@
 """
 Middleware components for the LoFi IA YouTube API.
+
+All middlewares are plain ASGI callables rather than ``BaseHTTPMiddleware``
+subclasses, so stacking them costs a function call per layer instead of an
+extra task and memory channel per request.
 """
+import socket
 import time
 import redis
-from typing import Callable
-from fastapi import Request, Response, HTTPException
+from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from datetime import datetime
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from logger import app_logger, log_with_context
 from settings import REDIS_URL
 
+# TCP keepalive probes so idle pooled connections are not silently dropped by
+# NATs/load balancers (the constants only exist on Linux)
+REDIS_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
+# Atomic fixed-window counter: adds a batch of locally counted hits in one
+# EVALSHA round-trip and returns the window total across all replicas
+RATE_LIMIT_SCRIPT = """
+local count = redis.call('INCRBY', KEYS[1], ARGV[2])
+if count == tonumber(ARGV[2]) then
+    redis.call('PEXPIRE', KEYS[1], ARGV[1])
+end
+return count
+"""
+
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
     Rate limiting middleware using Redis.
 
-    Implements a sliding window rate limiter to prevent API abuse.
+    Implements a fixed window counter, updated atomically by a Lua script,
+    to prevent API abuse. Hits are counted in-process and pushed to Redis
+    every ``sync_every`` requests or ``sync_interval`` seconds per IP, so most
+    requests are admitted or rejected without a Redis round-trip. Across
+    replicas the limit may be exceeded by up to ``sync_every - 1`` requests
+    per replica and window.
     """
 
-    def __init__(self, app, redis_url: str = None, requests_per_minute: int = 60):
+    def __init__(
+        self,
+        app: ASGIApp,
+        redis_url: str = None,
+        requests_per_minute: int = 60,
+        sync_every: int = 10,
+        sync_interval: float = 0.5,
+    ):
         """
         Initialize rate limiter.
 
@@ -28,14 +62,33 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             app: FastAPI application
             redis_url: Redis connection URL
             requests_per_minute: Maximum requests allowed per minute per IP
+            sync_every: Local hits per IP after which the count is pushed to Redis
+            sync_interval: Maximum seconds between Redis syncs for an active IP
         """
-        super().__init__(app)
+        self.app = app
         self.redis_url = redis_url or REDIS_URL
         self.requests_per_minute = requests_per_minute
         self.window_size = 60  # 60 seconds
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+
+        # ip -> [last count seen in Redis, hits not yet pushed, monotonic time of last sync]
+        self._local: dict = {}
+        self._local_window = None
 
         try:
-            self.redis_client = redis.from_url(self.redis_url, decode_responses=True)
+            pool = redis.ConnectionPool.from_url(
+                self.redis_url,
+                decode_responses=True,
+                max_connections=50,
+                socket_keepalive=True,
+                socket_keepalive_options=REDIS_KEEPALIVE_OPTIONS,
+                health_check_interval=30,
+                retry_on_timeout=True,
+            )
+            self.redis_client = redis.Redis(connection_pool=pool)
+            # Script objects run via EVALSHA and reload themselves on NOSCRIPT
+            self.rate_limit_script = self.redis_client.register_script(RATE_LIMIT_SCRIPT)
             self.redis_available = True
             app_logger.info("Rate limiting enabled with Redis")
         except Exception as e:
@@ -70,121 +123,149 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # Fallback to direct client IP
         return request.client.host if request.client else "unknown"
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request with rate limiting.
 
         Args:
-            request: Incoming request
-            call_next: Next middleware/route handler
-
-        Returns:
-            Response or rate limit error
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Skip rate limiting if Redis is not available
         if not self.redis_available:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Skip rate limiting for health check
-        if request.url.path == "/health":
-            return await call_next(request)
+        if scope["path"] == "/health":
+            await self.app(scope, receive, send)
+            return
 
+        request = Request(scope)
         client_ip = self.get_client_ip(request)
-        key = f"rate_limit:{client_ip}"
         current_time = int(time.time())
-
-        try:
-            # Get current request count
-            pipe = self.redis_client.pipeline()
-
-            # Remove old entries outside the time window
-            pipe.zremrangebyscore(key, 0, current_time - self.window_size)
-
-            # Count requests in current window
-            pipe.zcard(key)
-
-            # Add current request
-            pipe.zadd(key, {str(current_time): current_time})
-
-            # Set expiration
-            pipe.expire(key, self.window_size)
-
-            results = pipe.execute()
-            request_count = results[1]  # Result from zcard
-
-            # Check if rate limit exceeded
-            if request_count >= self.requests_per_minute:
+        window_index = current_time // self.window_size
+        window_reset = (window_index + 1) * self.window_size
+        # Short key: one small string per active IP and window
+        key = f"rl:{client_ip}:{window_index}"
+
+        # Local counters only ever cover the current window
+        if window_index != self._local_window:
+            self._local.clear()
+            self._local_window = window_index
+        entry = self._local.get(client_ip)
+        if entry is None:
+            entry = self._local[client_ip] = [0, 0, float("-inf")]
+        entry[1] += 1
+
+        now = time.monotonic()
+        if entry[1] >= self.sync_every or now - entry[2] >= self.sync_interval:
+            try:
+                # Push pending hits; Redis returns the total across replicas
+                entry[0] = self.rate_limit_script(keys=[key], args=[self.window_size * 1000, entry[1]])
+                entry[1] = 0
+                entry[2] = now
+            except Exception as e:
+                # If Redis fails, allow request but log error
                 log_with_context(
                     app_logger,
-                    "warning",
-                    "Rate limit exceeded",
+                    "error",
+                    "Rate limiting error",
                     client_ip=client_ip,
-                    request_count=request_count,
-                    limit=self.requests_per_minute,
-                    path=request.url.path
+                    error=str(e)
                 )
+                await self.app(scope, receive, send)
+                return
+        request_count = entry[0] + entry[1]
 
-                return JSONResponse(
-                    status_code=429,
-                    content={
-                        "detail": "Rate limit exceeded. Please try again later.",
-                        "limit": self.requests_per_minute,
-                        "window": f"{self.window_size} seconds",
-                        "retry_after": self.window_size
-                    },
-                    headers={
-                        "Retry-After": str(self.window_size),
-                        "X-RateLimit-Limit": str(self.requests_per_minute),
-                        "X-RateLimit-Remaining": "0",
-                        "X-RateLimit-Reset": str(current_time + self.window_size)
-                    }
-                )
-
-            # Add rate limit headers to response
-            response = await call_next(request)
-            response.headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
-            response.headers["X-RateLimit-Remaining"] = str(
-                max(0, self.requests_per_minute - request_count - 1)
-            )
-            response.headers["X-RateLimit-Reset"] = str(current_time + self.window_size)
-
-            return response
-
-        except Exception as e:
-            # If Redis fails, allow request but log error
+        # Check if rate limit exceeded
+        if request_count > self.requests_per_minute:
             log_with_context(
                 app_logger,
-                "error",
-                "Rate limiting error",
+                "warning",
+                "Rate limit exceeded",
                 client_ip=client_ip,
-                error=str(e)
+                request_count=request_count,
+                limit=self.requests_per_minute,
+                path=scope["path"]
             )
-            return await call_next(request)
 
+            response = JSONResponse(
+                status_code=429,
+                content={
+                    "detail": "Rate limit exceeded. Please try again later.",
+                    "limit": self.requests_per_minute,
+                    "window": f"{self.window_size} seconds",
+                    "retry_after": window_reset - current_time
+                },
+                headers={
+                    "Retry-After": str(window_reset - current_time),
+                    "X-RateLimit-Limit": str(self.requests_per_minute),
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": str(window_reset)
+                }
+            )
+            await response(scope, receive, send)
+            return
+
+        # Add rate limit headers to response
+        rate_limit_headers = {
+            "X-RateLimit-Limit": str(self.requests_per_minute),
+            "X-RateLimit-Remaining": str(max(0, self.requests_per_minute - request_count)),
+            "X-RateLimit-Reset": str(window_reset),
+        }
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(rate_limit_headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+
+class RequestLoggingMiddleware:
     """
     Middleware to log all incoming requests and responses.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp, excluded_paths: frozenset = frozenset({"/health", "/metrics"})):
         """
-        Log request and response details.
+        Initialize request logger.
 
         Args:
-            request: Incoming request
-            call_next: Next middleware/route handler
+            app: FastAPI application
+            excluded_paths: Paths passed through without logging or timing
+                (probes and scrapes that would otherwise dominate log volume)
+        """
+        self.app = app
+        self.excluded_paths = frozenset(excluded_paths)
 
-        Returns:
-            Response from handler
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Log request and response details.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Start timing
-        start_time = time.time()
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        # Start timing (monotonic integer ns; converted to ms only when reported)
+        start_ns = time.perf_counter_ns()
 
         # Extract request details
+        request = Request(scope)
         client_ip = request.client.host if request.client else "unknown"
-        method = request.method
-        path = request.url.path
+        method = scope["method"]
+        path = scope["path"]
         query_params = str(request.query_params) if request.query_params else None
 
         # Log incoming request
@@ -198,33 +279,25 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             query_params=query_params
         )
 
-        # Process request
-        try:
-            response = await call_next(request)
+        response_info = {}
 
-            # Calculate processing time
-            process_time = time.time() - start_time
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate processing time once the response is ready
+                process_time_ms = round((time.perf_counter_ns() - start_ns) / 1e6, 2)
+                response_info["status_code"] = message["status"]
+                response_info["process_time_ms"] = process_time_ms
 
-            # Log response
-            log_with_context(
-                app_logger,
-                "info",
-                "Request completed",
-                method=method,
-                path=path,
-                status_code=response.status_code,
-                process_time_ms=round(process_time * 1000, 2),
-                client_ip=client_ip
-            )
-
-            # Add processing time header
-            response.headers["X-Process-Time"] = str(round(process_time * 1000, 2))
-
-            return response
+                # Add processing time header
+                MutableHeaders(scope=message)["X-Process-Time"] = str(process_time_ms)
+            await send(message)
 
+        # Process request
+        try:
+            await self.app(scope, receive, send_with_timing)
         except Exception as e:
             # Log errors
-            process_time = time.time() - start_time
+            process_time_ms = round((time.perf_counter_ns() - start_ns) / 1e6, 2)
             log_with_context(
                 app_logger,
                 "error",
@@ -232,18 +305,32 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 method=method,
                 path=path,
                 error=str(e),
-                process_time_ms=round(process_time * 1000, 2),
+                process_time_ms=process_time_ms,
                 client_ip=client_ip
             )
             raise
 
+        # Log response
+        log_with_context(
+            app_logger,
+            "info",
+            "Request completed",
+            method=method,
+            path=path,
+            status_code=response_info.get("status_code"),
+            process_time_ms=response_info.get(
+                "process_time_ms", round((time.perf_counter_ns() - start_ns) / 1e6, 2)
+            ),
+            client_ip=client_ip
+        )
+
 
-class CORSSecurityMiddleware(BaseHTTPMiddleware):
+class CORSSecurityMiddleware:
     """
     Enhanced CORS and security headers middleware.
     """
 
-    def __init__(self, app, allowed_origins: list = None):
+    def __init__(self, app: ASGIApp, allowed_origins: list = None):
         """
         Initialize CORS middleware.
 
@@ -251,34 +338,50 @@ class CORSSecurityMiddleware(BaseHTTPMiddleware):
             app: FastAPI application
             allowed_origins: List of allowed origins (default: ["*"])
         """
-        super().__init__(app)
-        self.allowed_origins = allowed_origins or ["*"]
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        self.app = app
+        self.allowed_origins = frozenset(allowed_origins or ["*"])
+        self.allow_any_origin = "*" in self.allowed_origins
+
+        # Header values never change, so they are built once
+        self._security_headers = {
+            "X-Content-Type-Options": "nosniff",
+            "X-Frame-Options": "DENY",
+            "X-XSS-Protection": "1; mode=block",
+            "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+        }
+        self._cors_headers = {
+            "Access-Control-Allow-Credentials": "true",
+            "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
+            "Access-Control-Allow-Headers": "Content-Type, Authorization",
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Add security headers to response.
 
         Args:
-            request: Incoming request
-            call_next: Next middleware/route handler
-
-        Returns:
-            Response with security headers
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        response = await call_next(request)
-
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-        # CORS headers
-        origin = request.headers.get("origin")
-        if origin and (self.allowed_origins == ["*"] or origin in self.allowed_origins):
-            response.headers["Access-Control-Allow-Origin"] = origin
-            response.headers["Access-Control-Allow-Credentials"] = "true"
-            response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
-            response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization"
-
-        return response
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = Headers(scope=scope).get("origin")
+        allow_origin = bool(origin) and (self.allow_any_origin or origin in self.allowed_origins)
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+
+                # Add security headers
+                headers.update(self._security_headers)
+
+                # CORS headers
+                if allow_origin:
+                    headers["Access-Control-Allow-Origin"] = origin
+                    headers.update(self._cors_headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
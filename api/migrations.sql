@@ -6,6 +6,10 @@ CREATE TABLE IF NOT EXISTS events (
   payload JSONB NOT NULL
 );
 
+-- Covering index for /events keyset pagination (index-only scans, PG 11+)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_events_id_desc
+  ON events (id DESC) INCLUDE (created_at, kind, status);
+
 CREATE TABLE IF NOT EXISTS videos (
   id BIGSERIAL PRIMARY KEY,
   created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
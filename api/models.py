@@ -1,12 +1,17 @@
 """
 SQLAlchemy ORM models for the LoFi IA YouTube application.
 """
-from sqlalchemy import Column, BigInteger, Text, Integer, TIMESTAMP, ARRAY
+from datetime import datetime
+from typing import Any, List, Optional
+
+from sqlalchemy import BigInteger, Text, Integer, TIMESTAMP, ARRAY, Index
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Declarative base shared by all ORM models."""
 
 
 class Event(Base):
@@ -22,11 +27,20 @@ class Event(Base):
     """
     __tablename__ = "events"
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
-    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
-    kind = Column(Text, nullable=False)
-    status = Column(Text, nullable=False, default='ok')
-    payload = Column(JSONB, nullable=False)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), server_default=func.now())
+    kind: Mapped[str] = mapped_column(Text)
+    status: Mapped[str] = mapped_column(Text, default='ok')
+    payload: Mapped[Any] = mapped_column(JSONB)
+
+    __table_args__ = (
+        # Covering index used by /events keyset pagination
+        Index(
+            "idx_events_id_desc",
+            id.column.desc(),
+            postgresql_include=["created_at", "kind", "status"],
+        ),
+    )
 
     def __repr__(self):
         return f"<Event(id={self.id}, kind='{self.kind}', status='{self.status}')>"
@@ -49,15 +63,15 @@ class Video(Base):
     """
     __tablename__ = "videos"
 
-    id = Column(BigInteger, primary_key=True, autoincrement=True)
-    created_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
-    title = Column(Text)
-    description = Column(Text)
-    tags = Column(ARRAY(Text))
-    duration_sec = Column(Integer)
-    file_path = Column(Text)
-    youtube_video_id = Column(Text)
-    status = Column(Text, nullable=False, default='pending')
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), server_default=func.now())
+    title: Mapped[Optional[str]] = mapped_column(Text)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    tags: Mapped[Optional[List[str]]] = mapped_column(ARRAY(Text))
+    duration_sec: Mapped[Optional[int]] = mapped_column(Integer)
+    file_path: Mapped[Optional[str]] = mapped_column(Text)
+    youtube_video_id: Mapped[Optional[str]] = mapped_column(Text)
+    status: Mapped[str] = mapped_column(Text, default='pending')
 
     def __repr__(self):
         return f"<Video(id={self.id}, title='{self.title}', youtube_id='{self.youtube_video_id}')>"
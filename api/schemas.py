@@ -3,7 +3,10 @@ Pydantic schemas for request/response validation and API documentation.
 """
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Response models are built once per row/response and never mutated afterwards
+RESPONSE_CONFIG = ConfigDict(from_attributes=True, frozen=True)
 
 
 class HealthResponse(BaseModel):
@@ -13,12 +16,16 @@ class HealthResponse(BaseModel):
     redis: str = Field(..., description="Redis connection status")
     timestamp: datetime = Field(..., description="Current server timestamp")
 
+    model_config = RESPONSE_CONFIG
+
 
 class PipelineRunResponse(BaseModel):
     """Response model for pipeline run endpoint."""
     task_id: str = Field(..., description="Celery task ID")
     status: str = Field(..., description="Task status (queued, running, completed, failed)")
 
+    model_config = RESPONSE_CONFIG
+
 
 class EventResponse(BaseModel):
     """Response model for event records."""
@@ -27,8 +34,7 @@ class EventResponse(BaseModel):
     kind: str = Field(..., description="Event type")
     status: str = Field(..., description="Event status")
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class EventDetailResponse(EventResponse):
@@ -56,8 +62,7 @@ class VideoResponse(BaseModel):
     youtube_video_id: Optional[str] = Field(None, description="YouTube video ID")
     status: str = Field(..., description="Video status")
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class ErrorResponse(BaseModel):
@@ -65,3 +70,5 @@ class ErrorResponse(BaseModel):
     detail: str = Field(..., description="Error message")
     error_code: Optional[str] = Field(None, description="Error code")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
+
+    model_config = RESPONSE_CONFIG
@@ -0,0 +1,24 @@
+"""Font loading shared by the image and thumbnail renderers."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from PIL import ImageFont
+
+DEFAULT_FONT = "DejaVuSans-Bold.ttf"
+
+
+@lru_cache(maxsize=32)
+def load_font(size: int, path: str = DEFAULT_FONT) -> ImageFont.ImageFont:
+    """Return the TrueType font at ``size``, falling back to Pillow's default.
+
+    Fonts are cached per (size, path) so the TTF file is parsed and the
+    FreeType face created only once per process.  Pillow fonts are not
+    mutated while drawing, so sharing them between renders is safe.
+    """
+
+    try:
+        return ImageFont.truetype(path, size=size)
+    except OSError:
+        return ImageFont.load_default()
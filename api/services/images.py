@@ -13,10 +13,13 @@ of :func:`generate_image_16x9`.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+
+from .fonts import load_font
 
 # Default HD size in 16:9 ratio.  The actual APIs usually return at least this
 # resolution, so using it here gives ffmpeg enough pixels to work with.
@@ -27,42 +30,58 @@ def _ensure_parent_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def _draw_background(draw: ImageDraw.ImageDraw, size: Tuple[int, int]) -> None:
-    """Create a simple vertical gradient to avoid a flat looking placeholder."""
+def _draw_background(size: Tuple[int, int]) -> Image.Image:
+    """Create a simple vertical gradient to avoid a flat looking placeholder.
+
+    The gradient only varies vertically, so a single 1-pixel wide RGBA column
+    is built from raw bytes and stretched across the width by Pillow instead
+    of drawing one line per scanline.
+    """
 
     width, height = size
-    top_colour = (20, 24, 52)
-    bottom_colour = (112, 93, 198)
-    for y in range(height):
-        ratio = y / max(height - 1, 1)
-        r = int(top_colour[0] + ratio * (bottom_colour[0] - top_colour[0]))
-        g = int(top_colour[1] + ratio * (bottom_colour[1] - top_colour[1]))
-        b = int(top_colour[2] + ratio * (bottom_colour[2] - top_colour[2]))
-        draw.line([(0, y), (width, y)], fill=(r, g, b))
+    top_colour = (20, 24, 52, 255)
+    bottom_colour = (112, 93, 198, 255)
+    span = max(height - 1, 1)
+    column = bytes(
+        int(top + (y / span) * (bottom - top))
+        for y in range(height)
+        for top, bottom in zip(top_colour, bottom_colour)
+    )
+    return Image.frombytes("RGBA", (1, height), column).resize((width, height), Image.NEAREST)
+
+
+@lru_cache(maxsize=4)
+def _template(size: Tuple[int, int]) -> Image.Image:
+    """Background and centerpiece, which do not depend on the prompt.
+
+    Rendered once per size and stored in RGB so the per-call work needs no
+    alpha channel or final conversion; callers draw the prompt on a copy,
+    never on the cached image itself.
+    """
+
+    image = _draw_background(size)
+    _draw_centerpiece(ImageDraw.Draw(image, "RGBA"), size)
+    return image.convert("RGB")
 
 
 def _draw_prompt_overlay(draw: ImageDraw.ImageDraw, size: Tuple[int, int], prompt: str) -> None:
-    """Add the (truncated) prompt on top of a semi-transparent rectangle."""
+    """Add the (truncated) prompt on top of a dark band."""
 
     width, height = size
     overlay_height = int(height * 0.22)
     top = height - overlay_height
-    draw.rectangle([(0, top), (width, height)], fill=(0, 0, 0, 160))
+    draw.rectangle([(0, top), (width, height)], fill=(0, 0, 0))
 
-    try:
-        font = ImageFont.truetype("DejaVuSans-Bold.ttf", size=int(height * 0.045))
-    except OSError:
-        font = ImageFont.load_default()
+    font = load_font(int(height * 0.045))
 
     text = prompt.strip() or "Lo-Fi Midnight Café"
     max_chars = 120
     if len(text) > max_chars:
         text = text[: max_chars - 1] + "…"
 
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width, text_height = bbox[2] - bbox[0], bbox[3] - bbox[1]
-    position = ((width - text_width) / 2, top + (overlay_height - text_height) / 2)
-    draw.text(position, text, fill=(240, 240, 255), font=font)
+    # Middle/middle anchor centers the text without a separate textbbox pass
+    centre = (width / 2, top + overlay_height / 2)
+    draw.text(centre, text, fill=(240, 240, 255), font=font, anchor="mm")
 
 
 def _draw_centerpiece(draw: ImageDraw.ImageDraw, size: Tuple[int, int]) -> None:
@@ -88,17 +107,19 @@ def generate_image_16x9(prompt: str, out_path: str) -> str:
     prompt:
         Text prompt describing the desired artwork.
     out_path:
-        Destination path where the PNG should be stored.
+        Destination path.  A ``.jpg``/``.jpeg`` suffix stores a JPEG (the
+        frame is only consumed by ffmpeg and the thumbnail renderer, and JPEG
+        encodes several times faster than zlib); anything else stores a PNG.
     """
 
     path = Path(out_path)
     _ensure_parent_dir(path)
 
-    image = Image.new("RGBA", DEFAULT_SIZE)
-    draw = ImageDraw.Draw(image, "RGBA")
-    _draw_background(draw, DEFAULT_SIZE)
-    _draw_centerpiece(draw, DEFAULT_SIZE)
-    _draw_prompt_overlay(draw, DEFAULT_SIZE, prompt)
+    image = _template(DEFAULT_SIZE).copy()
+    _draw_prompt_overlay(ImageDraw.Draw(image), DEFAULT_SIZE, prompt)
 
-    image.convert("RGB").save(path, format="PNG")
+    if path.suffix.lower() in (".jpg", ".jpeg"):
+        image.save(path, format="JPEG", quality=92)
+    else:
+        image.save(path, format="PNG")
     return str(path)
\ No newline at end of file
@@ -1,23 +1,34 @@
+import os
 import random
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Sequence
 
 
 class AudioSelectionError(RuntimeError):
     """Raised when a playlist cannot be generated from the provided directory."""
 
 
-def _list_mp3_files(directory: Path) -> list[Path]:
-    if not directory.exists():
-        raise AudioSelectionError(f"Audio directory '{directory}' does not exist")
-    files = sorted(p for p in directory.iterdir() if p.suffix.lower() == ".mp3")
-    if not files:
+def _list_mp3_files(directory: Path) -> list[str]:
+    # scandir yields names and d_type from the directory listing itself, so no
+    # per-entry stat or Path object is needed; only picked tracks become Paths
+    try:
+        with os.scandir(directory) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if entry.name.lower().endswith(".mp3") and entry.is_file()
+            ]
+    except FileNotFoundError:
+        raise AudioSelectionError(f"Audio directory '{directory}' does not exist") from None
+    if not names:
         raise AudioSelectionError(f"Audio directory '{directory}' does not contain any MP3 file")
-    return files
+    return names
 
 
-def _choose_tracks(files: Iterable[Path], min_n: int, max_n: int) -> list[Path]:
-    files = list(files)
+def _choose_tracks(files: Iterable[str], min_n: int, max_n: int) -> list[str]:
+    # random.sample indexes sequences directly; only materialise other iterables
+    if not isinstance(files, Sequence):
+        files = list(files)
     if min_n < 1:
         raise ValueError("min_n must be positive")
     if max_n < min_n:
@@ -49,15 +60,13 @@ def select_audio_playlist(
     """
 
     directory = Path(audiodir)
-    tracks = _choose_tracks(_list_mp3_files(directory), min_n, max_n)
+    tracks = [directory / name for name in _choose_tracks(_list_mp3_files(directory), min_n, max_n)]
 
     if list_file is None:
         playlist_path = directory / "playlist.txt"
     else:
         playlist_path = Path(list_file)
     playlist_path.parent.mkdir(parents=True, exist_ok=True)
-    with playlist_path.open("w", encoding="utf-8") as fh:
-        for track in tracks:
-            fh.write(f"file '{track.as_posix()}'\n")
+    playlist_path.write_text("".join(f"file '{track.as_posix()}'\n" for track in tracks), encoding="utf-8")
 
     return str(playlist_path), [track.name for track in tracks]
\ No newline at end of file
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from PIL import Image, ImageDraw, ImageFilter, ImageFont
+from PIL import Image, ImageDraw, ImageFilter
+
+from .fonts import load_font
 
 
 def _load_base_image(path: Path) -> Image.Image:
@@ -14,33 +16,62 @@ def _load_base_image(path: Path) -> Image.Image:
     return image
 
 
+# Blur applied to the title overlay; BLUR_MARGIN covers how far it bleeds
+# above the bar, so only that strip needs to be blurred
+BLUR_RADIUS = 4
+BLUR_MARGIN = 4 * BLUR_RADIUS
+
+
 def _draw_text(image: Image.Image, title: str) -> None:
-    draw = ImageDraw.Draw(image)
-    overlay = Image.new("RGBA", image.size, (0, 0, 0, 0))
-    overlay_draw = ImageDraw.Draw(overlay)
     bar_height = int(image.height * 0.28)
+    # Everything drawn lives in the bottom bar: build the overlay for that
+    # strip (plus the blur bleed) instead of the whole frame
+    strip_top = max(image.height - bar_height - BLUR_MARGIN, 0)
+    overlay = Image.new("RGBA", (image.width, image.height - strip_top), (0, 0, 0, 0))
+    overlay_draw = ImageDraw.Draw(overlay)
+    bar_top = image.height - bar_height - strip_top
     overlay_draw.rectangle(
-        [(0, image.height - bar_height), (image.width, image.height)],
+        [(0, bar_top), (image.width, overlay.height)],
         fill=(16, 16, 30, 200),
     )
 
-    try:
-        font = ImageFont.truetype("DejaVuSans-Bold.ttf", size=int(image.height * 0.09))
-    except OSError:
-        font = ImageFont.load_default()
+    font = load_font(int(image.height * 0.09))
 
     text = title.strip() or "Lo-Fi Midnight Café"
     max_chars = 60
     if len(text) > max_chars:
         text = text[: max_chars - 1] + "…"
 
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width, text_height = bbox[2] - bbox[0], bbox[3] - bbox[1]
-    position = ((image.width - text_width) / 2, image.height - bar_height + (bar_height - text_height) / 2)
-    overlay_draw.text(position, text, font=font, fill=(245, 238, 219, 255))
+    # Middle/middle anchor centers the text without a separate textbbox pass
+    centre = (image.width / 2, bar_top + bar_height / 2)
+    overlay_draw.text(centre, text, font=font, fill=(245, 238, 219, 255), anchor="mm")
+
+    # Blurring a flat area is a no-op, so only the bar's top edge and the text
+    # box (each padded by the blur bleed) are blurred; the rest is kept as drawn
+    text_box = overlay_draw.textbbox(centre, text, font=font, anchor="mm")
+    blurred = overlay.copy()
+    for box in (
+        (0, 0, overlay.width, bar_top + BLUR_MARGIN),
+        (
+            max(int(text_box[0]) - BLUR_MARGIN, 0),
+            max(int(text_box[1]) - BLUR_MARGIN, 0),
+            min(int(text_box[2]) + 1 + BLUR_MARGIN, overlay.width),
+            min(int(text_box[3]) + 1 + BLUR_MARGIN, overlay.height),
+        ),
+    ):
+        _blur_region(overlay, blurred, box)
+    image.paste(blurred, (0, strip_top), blurred)
+
 
-    blurred = overlay.filter(ImageFilter.GaussianBlur(radius=4))
-    image.paste(blurred, (0, 0), blurred)
+def _blur_region(source: Image.Image, target: Image.Image, box: tuple[int, int, int, int]) -> None:
+    # Blur the box with BLUR_MARGIN of surrounding context, then keep only the box
+    left, top, right, bottom = box
+    ctx_left, ctx_top = max(left - BLUR_MARGIN, 0), max(top - BLUR_MARGIN, 0)
+    region = source.crop(
+        (ctx_left, ctx_top, min(right + BLUR_MARGIN, source.width), min(bottom + BLUR_MARGIN, source.height))
+    ).filter(ImageFilter.GaussianBlur(radius=BLUR_RADIUS))
+    inner = region.crop((left - ctx_left, top - ctx_top, right - ctx_left, bottom - ctx_top))
+    target.paste(inner, (left, top))
 
 
 def render_thumbnail(base_image: str, title: str, out_path: str) -> str:
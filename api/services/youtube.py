@@ -10,12 +10,14 @@ YouTube API is used transparently.
 
 from __future__ import annotations
 
-import json
 import os
+import shutil
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
+import orjson
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
@@ -24,6 +26,11 @@ CLIENT_ID = os.getenv("YOUTUBE_CLIENT_ID")
 CLIENT_SECRET = os.getenv("YOUTUBE_CLIENT_SECRET")
 REFRESH_TOKEN = os.getenv("YOUTUBE_REFRESH_TOKEN")
 
+# Uploads are sent in resumable chunks so only one chunk is held in memory at a
+# time and a transient failure resumes from the last acknowledged byte.
+UPLOAD_CHUNKSIZE = 8 * 1024 * 1024
+UPLOAD_NUM_RETRIES = 3
+
 SCOPES = [
     "https://www.googleapis.com/auth/youtube.upload",
     "https://www.googleapis.com/auth/youtube",
@@ -34,7 +41,11 @@ def _has_credentials() -> bool:
     return all([CLIENT_ID, CLIENT_SECRET, REFRESH_TOKEN])
 
 
+@lru_cache(maxsize=1)
 def youtube_client():
+    # Built once per worker process: discovery parsing and credential setup are
+    # skipped on later uploads (prefork workers run one task at a time, so the
+    # non thread-safe httplib2 transport is never shared concurrently)
     if not _has_credentials():
         raise RuntimeError("YouTube credentials are not configured")
     creds = Credentials(
@@ -45,7 +56,15 @@ def youtube_client():
         client_secret=CLIENT_SECRET,
         scopes=SCOPES,
     )
-    return build("youtube", "v3", credentials=creds)
+    # Use the discovery document bundled with google-api-python-client instead of fetching it
+    return build("youtube", "v3", credentials=creds, static_discovery=True, cache_discovery=False)
+
+
+def _execute_resumable(request) -> dict:
+    response = None
+    while response is None:
+        _status, response = request.next_chunk(num_retries=UPLOAD_NUM_RETRIES)
+    return response
 
 
 def _simulate_upload(path: str, title: str, description: str, tags: Iterable[str]) -> str:
@@ -60,7 +79,7 @@ def _simulate_upload(path: str, title: str, description: str, tags: Iterable[str
         "source_file": os.path.abspath(path),
         "created_at": time.time(),
     }
-    metadata_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    metadata_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
     return video_id
 
 
@@ -69,7 +88,7 @@ def upload_video(path: str, title: str, description: str, tags: list[str]) -> st
         return _simulate_upload(path, title, description, tags)
 
     yt = youtube_client()
-    media = MediaFileUpload(path, chunksize=-1, resumable=True)
+    media = MediaFileUpload(path, mimetype="video/mp4", chunksize=UPLOAD_CHUNKSIZE, resumable=True)
     insert = yt.videos().insert(
         part="snippet,status",
         body={
@@ -83,7 +102,7 @@ def upload_video(path: str, title: str, description: str, tags: list[str]) -> st
         },
         media_body=media,
     )
-    resp = insert.execute()
+    resp = _execute_resumable(insert)
     return resp["id"]
 
 
@@ -92,9 +111,15 @@ def set_thumbnail(video_id: str, thumbnail_path: str):
         uploads_dir = Path(os.getenv("MEDIA_ROOT", "/data")) / "simulated_uploads"
         uploads_dir.mkdir(parents=True, exist_ok=True)
         thumb_copy = uploads_dir / f"{video_id}_thumbnail{Path(thumbnail_path).suffix}"
-        thumb_copy.write_bytes(Path(thumbnail_path).read_bytes())
+        # Hard link when on the same filesystem, otherwise a kernel-side copy;
+        # never read the image into Python memory
+        thumb_copy.unlink(missing_ok=True)
+        try:
+            os.link(thumbnail_path, thumb_copy)
+        except OSError:
+            shutil.copyfile(thumbnail_path, thumb_copy)
         return
 
     yt = youtube_client()
-    media = MediaFileUpload(thumbnail_path, chunksize=-1, resumable=True)
-    yt.thumbnails().set(videoId=video_id, media_body=media).execute()
\ No newline at end of file
+    media = MediaFileUpload(thumbnail_path, chunksize=UPLOAD_CHUNKSIZE, resumable=True)
+    _execute_resumable(yt.thumbnails().set(videoId=video_id, media_body=media))
\ No newline at end of file
@@ -1,53 +1,79 @@
 import os, datetime
+from concurrent.futures import ThreadPoolExecutor
 from celery import Celery
+from celery.signals import worker_process_shutdown
 from settings import REDIS_URL, AUDIO_DIR, LOOP_VIDEO, INTRO_VIDEO, OUTRO_VIDEO, DEFAULT_TITLE, DEFAULT_DESCRIPTION, DEFAULT_TAGS
-from db import SessionLocal, log_event
-from services.music import select_audio_playlist
-from services.images import generate_image_16x9
-from services.animate import animate_to_loop
-from services.thumbnails import render_thumbnail
-from services.youtube import upload_video, set_thumbnail
-from ffmpeg_utils import concat_audio_from_list, loop_video_to_duration
+from db import flush_events, log_event
 
 celery = Celery(__name__, broker=REDIS_URL, backend=REDIS_URL)
+# Pipeline runs take minutes: reserve one task at a time and only ack once done,
+# so idle workers can pick up queued runs and a crashed worker's run is redelivered
+# The Redis transport redelivers unacked tasks after visibility_timeout (1 h by
+# default): keep it above the longest render + upload, or a late-acked run would
+# be started again on another worker and publish a duplicate video
+PIPELINE_VISIBILITY_TIMEOUT = 12 * 3600
+celery.conf.update(
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    broker_transport_options={"visibility_timeout": PIPELINE_VISIBILITY_TIMEOUT},
+)
 
-@celery.task(name="pipeline.generate_and_publish")
+@worker_process_shutdown.connect
+def _flush_events_on_shutdown(**kwargs):
+    # Pool children may exit without running atexit hooks
+    flush_events()
+
+@celery.task(name="pipeline.generate_and_publish", acks_late=True)
 def generate_and_publish():
-    db = SessionLocal()
+    # Pipeline dependencies (Pillow, Google API client, ...) are imported on first run
+    # so the API, which only enqueues this task, never loads them
+    from services.music import select_audio_playlist
+    from services.images import generate_image_16x9
+    from services.animate import animate_to_loop
+    from services.thumbnails import render_thumbnail
+    from services.youtube import upload_video, set_thumbnail
+    from ffmpeg_utils import concat_audio_from_list, loop_video_to_duration
+
     try:
         date_tag = datetime.date.today().isoformat()
-        # 1) Image
-        img_path = f"/data/frame_{date_tag}.png"
-        generate_image_16x9("lofi cafe at night, anime style, warm lights, rain, 16:9", img_path)
 
-        # 2) Animation loop (ou utiliser un loop pre-existant)
-        loop_path = LOOP_VIDEO
-        if not os.path.exists(loop_path):
-            loop_path = animate_to_loop(img_path, "/data/loop.mp4", 6)
+        # 3-4) Playlist + concat audio: independent of the visuals, so it runs on a
+        # second thread (ffmpeg is a subprocess and Pillow releases the GIL)
+        def prepare_audio():
+            playlist_file, tracks = select_audio_playlist(AUDIO_DIR, 80, 120)
+            audio_path = "/data/audio.mp3"
+            concat_audio_from_list(playlist_file, audio_path)
+            return audio_path, tracks
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipeline-audio") as pool:
+            audio_future = pool.submit(prepare_audio)
 
-        # 3) Playlist audio
-        playlist_file, tracks = select_audio_playlist(AUDIO_DIR, 80, 120)
+            # 1) Image
+            img_path = f"/data/frame_{date_tag}.jpg"
+            generate_image_16x9("lofi cafe at night, anime style, warm lights, rain, 16:9", img_path)
 
-        # 4) Concat audio
-        audio_path = "/data/audio.mp3"
-        concat_audio_from_list(playlist_file, audio_path)
+            # 2) Animation loop (ou utiliser un loop pre-existant)
+            loop_path = LOOP_VIDEO
+            if not os.path.exists(loop_path):
+                loop_path = animate_to_loop(img_path, "/data/loop.mp4", 6)
+
+            # 6) Thumbnail (only needs the image)
+            thumb_path = f"/data/thumb_{date_tag}.jpg"
+            render_thumbnail(img_path, DEFAULT_TITLE, thumb_path)
+
+            audio_path, tracks = audio_future.result()
 
         # 5) Rendu vidéo
         out_video = f"/data/lofi_{date_tag}.mp4"
         loop_video_to_duration(loop_path, audio_path, out_video, intro=INTRO_VIDEO, outro=OUTRO_VIDEO)
 
-        # 6) Thumbnail
-        thumb_path = f"/data/thumb_{date_tag}.jpg"
-        render_thumbnail(img_path, DEFAULT_TITLE, thumb_path)
-
         # 7) Upload YouTube
         video_id = upload_video(out_video, f"{DEFAULT_TITLE} | {date_tag}", DEFAULT_DESCRIPTION, DEFAULT_TAGS)
         set_thumbnail(video_id, thumb_path)
 
-        log_event(db, "pipeline", {"video_id": video_id, "file": out_video, "tracks": tracks}, "ok")
+        log_event("pipeline", {"video_id": video_id, "file": out_video, "tracks": tracks}, "ok")
         return {"status": "ok", "video_id": video_id}
     except Exception as e:
-        log_event(db, "pipeline", {"error": str(e)}, "error")
+        log_event("pipeline", {"error": str(e)}, "error")
         raise
-    finally:
-        db.close()
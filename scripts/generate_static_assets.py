@@ -4,77 +4,141 @@ Generate basic static assets (intro/outro videos and thumbnail template).
 This script creates simple placeholder assets using FFmpeg and Pillow.
 """
 import os
+import subprocess
 import sys
-from PIL import Image, ImageDraw, ImageFont
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageDraw
 
 # Add api directory to path to import ffmpeg_utils
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "api"))
 
-try:
-    import ffmpeg
-except ImportError:
-    print("Error: ffmpeg-python not installed. Run: pip install ffmpeg-python")
-    sys.exit(1)
+from ffmpeg_utils import video_encoder_args
+from services.fonts import load_font
 
+BOLD_FONT = '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf'
+REGULAR_FONT = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
 
-def create_intro_video(output_path: str, duration: int = 3):
+# Fast zlib level for dev/CI runs; OPTIMIZE_ASSETS=1 when regenerating the
+# committed template, to get the smallest file
+PNG_SAVE_ARGS = {'optimize': True} if os.getenv('OPTIMIZE_ASSETS') == '1' else {'compress_level': 1}
+
+# Placeholder clips are solid colour + text: favour encode speed over size
+SW_ENCODER_ARGS = ['-c:v', 'libx264', '-preset', 'ultrafast', '-tune', 'stillimage', '-threads', '0']
+
+
+def _encoder_args() -> list:
     """
-    Create a simple intro video with fade-in effect.
+    Encoder flags for the encoder picked by ffmpeg_utils (VIDEO_ENCODER).
+
+    Returns:
+        ffmpeg output arguments
+    """
+    args = video_encoder_args()
+    # VAAPI needs an hwupload filter appended to the drawtext graph: use libx264
+    if "libx264" in args or "-vf" in args:
+        return SW_ENCODER_ARGS
+    return list(args)
+
+
+def intro_clip(output_path: str, duration: int = 3) -> dict:
+    """
+    Describe the intro video: "Lo-Fi IA YouTube" with a fade-in.
 
     Args:
         output_path: Path to save the intro video
         duration: Duration in seconds
+
+    Returns:
+        Clip spec for create_text_clips
     """
-    print(f"Creating intro video: {output_path}")
-
-    # Create a black video with "Lo-Fi IA YouTube" text
-    (
-        ffmpeg
-        .input(f'color=c=black:s=1920x1080:d={duration}', f='lavfi')
-        .drawtext(
-            text='Lo-Fi IA YouTube',
-            fontsize=72,
-            fontcolor='white',
-            x='(w-text_w)/2',
-            y='(h-text_h)/2',
-            fontfile='/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf'
-        )
-        .filter('fade', type='in', duration=1)
-        .output(output_path, pix_fmt='yuv420p', t=duration)
-        .overwrite_output()
-        .run(quiet=True)
-    )
-    print(f"✓ Intro video created ({duration}s)")
+    return {'path': output_path, 'duration': duration, 'text': 'Lo-Fi IA YouTube',
+            'fontsize': 72, 'fade': 't=in:d=1'}
 
 
-def create_outro_video(output_path: str, duration: int = 3):
+def outro_clip(output_path: str, duration: int = 3) -> dict:
     """
-    Create a simple outro video with fade-out effect.
+    Describe the outro video: "Subscribe for more!" with a fade-out.
 
     Args:
         output_path: Path to save the outro video
         duration: Duration in seconds
+
+    Returns:
+        Clip spec for create_text_clips
+    """
+    return {'path': output_path, 'duration': duration, 'text': 'Subscribe for more Lo-Fi beats!',
+            'fontsize': 56, 'fade': f't=out:st={duration - 1}:d=1'}
+
+
+def _text_clips_cmd(clips: list) -> list:
+    """
+    Build one ffmpeg command rendering every clip from a shared black source.
+
+    Args:
+        clips: Clip specs (see intro_clip / outro_clip)
+
+    Returns:
+        ffmpeg argv with one output per clip
     """
-    print(f"Creating outro video: {output_path}")
-
-    # Create a black video with "Subscribe for more!" text
-    (
-        ffmpeg
-        .input(f'color=c=black:s=1920x1080:d={duration}', f='lavfi')
-        .drawtext(
-            text='Subscribe for more Lo-Fi beats!',
-            fontsize=56,
-            fontcolor='white',
-            x='(w-text_w)/2',
-            y='(h-text_h)/2',
-            fontfile='/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf'
+    duration = max(clip['duration'] for clip in clips)
+    # The source pad can only be consumed once: split it, one branch per clip
+    graph = [f"[0:v]split={len(clips)}" + "".join(f"[s{i}]" for i in range(len(clips)))]
+    outputs = []
+    encoder = _encoder_args()
+    for i, clip in enumerate(clips):
+        graph.append(
+            f"[s{i}]drawtext=text='{clip['text']}':fontsize={clip['fontsize']}:fontcolor=white"
+            f":x=(w-text_w)/2:y=(h-text_h)/2:fontfile={BOLD_FONT},fade={clip['fade']}[v{i}]"
         )
-        .filter('fade', type='out', start_time=duration-1, duration=1)
-        .output(output_path, pix_fmt='yuv420p', t=duration)
-        .overwrite_output()
-        .run(quiet=True)
-    )
-    print(f"✓ Outro video created ({duration}s)")
+        outputs += ['-map', f'[v{i}]', '-pix_fmt', 'yuv420p', '-t', str(clip['duration']), *encoder, clip['path']]
+    return [
+        'ffmpeg', '-y', '-v', 'error', '-f', 'lavfi', '-i', f'color=c=black:s=1920x1080:d={duration}',
+        '-filter_complex', ";".join(graph), *outputs,
+    ]
+
+
+def create_text_clips(clips: list):
+    """
+    Create black title videos in a single ffmpeg invocation.
+
+    One process decodes the source once and feeds an encoder per output,
+    instead of spawning ffmpeg and building the filter graph per clip.
+
+    Args:
+        clips: Clip specs (see intro_clip / outro_clip)
+    """
+    for clip in clips:
+        print(f"Creating video: {clip['path']}")
+    subprocess.run(_text_clips_cmd(clips), check=True, capture_output=True)
+    for clip in clips:
+        print(f"✓ {os.path.basename(clip['path'])} created ({clip['duration']}s)")
+
+
+def _draw_shadowed_text(img, xy, text, font, fill, shadow_offset, anchor) -> tuple:
+    """
+    Draw text with a black drop shadow, rasterizing the glyphs only once.
+
+    The text is rendered into a coverage mask that is pasted twice: in black
+    at the shadow offset, then in ``fill`` at ``xy``.
+
+    Args:
+        img: RGB image to draw on
+        xy: Anchor position of the text
+        text: Text to draw
+        font: Font to render with
+        fill: RGB text colour
+        shadow_offset: Shadow offset in pixels, right and down
+        anchor: Pillow text anchor
+
+    Returns:
+        Bounding box of the foreground text
+    """
+    left, top, right, bottom = ImageDraw.Draw(img).textbbox(xy, text, font=font, anchor=anchor)
+    mask = Image.new('L', (right - left, bottom - top))
+    ImageDraw.Draw(mask).text((xy[0] - left, xy[1] - top), text, fill=255, font=font, anchor=anchor)
+    img.paste((0, 0, 0), (left + shadow_offset, top + shadow_offset), mask)
+    img.paste(fill, (left, top), mask)
+    return left, top, right, bottom
 
 
 def create_thumbnail_template(output_path: str):
@@ -88,20 +152,18 @@ def create_thumbnail_template(output_path: str):
 
     # Create 1280x720 image with gradient background
     width, height = 1280, 720
-    img = Image.new('RGB', (width, height))
-    draw = ImageDraw.Draw(img)
 
-    # Draw gradient background (dark blue to purple)
-    for y in range(height):
-        r = int(30 + (80 - 30) * y / height)
-        g = int(30 + (50 - 30) * y / height)
-        b = int(80 + (120 - 80) * y / height)
-        draw.rectangle([(0, y), (width, y + 1)], fill=(r, g, b))
-
-    # Add decorative elements
-    # Draw semi-transparent overlay
-    overlay = Image.new('RGBA', (width, height), (0, 0, 0, 100))
-    img.paste(overlay, (0, 0), overlay)
+    # Draw gradient background (dark blue to purple): it only varies
+    # vertically, so build one 1-pixel wide column and stretch it
+    top_colour, bottom_colour = (30, 30, 80), (80, 50, 120)
+    # Darken it as a black overlay at alpha 100 would (c * 155 / 255, rounded)
+    column = bytes(
+        (int(top + (bottom - top) * y / height) * (255 - 100) + 127) // 255
+        for y in range(height)
+        for top, bottom in zip(top_colour, bottom_colour)
+    )
+    img = Image.frombytes('RGB', (1, height), column).resize((width, height), Image.NEAREST)
+    draw = ImageDraw.Draw(img)
 
     # Add border
     border_width = 10
@@ -112,41 +174,27 @@ def create_thumbnail_template(output_path: str):
     )
 
     # Add placeholder text in center
-    try:
-        # Try to use a nice font
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 48)
-        small_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 24)
-    except:
-        # Fallback to default font
-        font = ImageFont.load_default()
-        small_font = font
+    # Cached per (size, path); falls back to Pillow's default font if missing
+    font = load_font(48, BOLD_FONT)
+    small_font = load_font(24, REGULAR_FONT)
 
     text = "Lo-Fi Beats"
     subtitle = "Study • Relax • Sleep"
 
-    # Calculate text position
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
-    text_x = (width - text_width) // 2
-    text_y = (height - text_height) // 2 - 40
+    # Anchored text: Pillow centres it, no manual width/height arithmetic
+    centre_x = width // 2
+    title_y = height // 2 - 40
 
     # Draw text with shadow
-    shadow_offset = 3
-    draw.text((text_x + shadow_offset, text_y + shadow_offset), text, fill=(0, 0, 0), font=font)
-    draw.text((text_x, text_y), text, fill=(255, 255, 255), font=font)
-
-    # Draw subtitle
-    bbox2 = draw.textbbox((0, 0), subtitle, font=small_font)
-    sub_width = bbox2[2] - bbox2[0]
-    sub_x = (width - sub_width) // 2
-    sub_y = text_y + text_height + 20
+    title_box = _draw_shadowed_text(img, (centre_x, title_y), text, font, (255, 255, 255), 3, 'mm')
 
-    draw.text((sub_x + 2, sub_y + 2), subtitle, fill=(0, 0, 0), font=small_font)
-    draw.text((sub_x, sub_y), subtitle, fill=(200, 200, 255), font=small_font)
+    # Draw subtitle below the title's ink ('ma' anchors its ascender, which
+    # sits a few pixels above the glyphs)
+    sub_y = title_box[3] + 12
+    _draw_shadowed_text(img, (centre_x, sub_y), subtitle, small_font, (200, 200, 255), 2, 'ma')
 
     # Save the image
-    img.save(output_path, 'PNG', quality=95)
+    img.save(output_path, 'PNG', **PNG_SAVE_ARGS)
     print(f"✓ Thumbnail template created (1280x720)")
 
 
@@ -165,17 +213,16 @@ def main():
     print("Generating Static Assets")
     print("=" * 60)
 
-    # Generate intro video
     intro_path = os.path.join(static_dir, "intro.mp4")
-    create_intro_video(intro_path, duration=3)
-
-    # Generate outro video
     outro_path = os.path.join(static_dir, "outro.mp4")
-    create_outro_video(outro_path, duration=3)
-
-    # Generate thumbnail template
     template_path = os.path.join(templates_dir, "thumbnail_template.png")
-    create_thumbnail_template(template_path)
+
+    # The assets are independent: encode intro/outro in one ffmpeg process
+    # while the thumbnail template is drawn on this thread
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        videos = pool.submit(create_text_clips, [intro_clip(intro_path, 3), outro_clip(outro_path, 3)])
+        create_thumbnail_template(template_path)
+        videos.result()
 
     print("=" * 60)
     print("✓ All static assets generated successfully!")
@@ -14,10 +14,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "api"))
 from app import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client() -> Generator[TestClient, None, None]:
     """
-    Create a FastAPI test client.
+    Create a FastAPI test client shared by the whole session.
+
+    The app's startup/shutdown handlers run once instead of once per test.
+    Tests that need different behavior monkeypatch module attributes, which
+    is undone after each test, rather than mutating app state.
 
     Yields:
         TestClient instance for making API requests
@@ -36,6 +36,53 @@ def test_health_endpoint_response_model(client: TestClient):
     assert set(data.keys()) == expected_keys
 
 
+@pytest.mark.unit
+def test_health_endpoint_caches_backend_status(client: TestClient, monkeypatch):
+    """Test the /health endpoint does not re-probe Redis within the check interval."""
+    import app as app_module
+
+    pings = []
+
+    class FakeRedis:
+        async def ping(self):
+            pings.append(True)
+            return True
+
+    monkeypatch.setattr(app_module, "get_health_redis", lambda: FakeRedis())
+    monkeypatch.setattr(app_module, "_last_ping_ts", float("-inf"))
+
+    first = client.get("/health")
+    second = client.get("/health")
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json()["redis"] == "ok"
+    assert len(pings) == 1
+
+
+@pytest.mark.unit
+def test_health_endpoint_probe_timeout(client: TestClient, monkeypatch):
+    """Test a hanging Redis probe is reported as an error instead of blocking /health."""
+    import asyncio
+    import app as app_module
+
+    class SlowRedis:
+        async def ping(self):
+            await asyncio.sleep(5)
+            return True
+
+    monkeypatch.setattr(app_module, "get_health_redis", lambda: SlowRedis())
+    monkeypatch.setattr(app_module, "HEALTH_PROBE_TIMEOUT", 0.05)
+    monkeypatch.setattr(app_module, "_last_ping_ts", float("-inf"))
+
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["redis"] == "error"
+    assert data["status"] == "degraded"
+
+
 @pytest.mark.unit
 def test_events_endpoint_default_limit(client: TestClient):
     """Test the /events endpoint with default limit."""
@@ -79,6 +126,27 @@ def test_events_endpoint_validation_max_limit(client: TestClient):
     assert response.status_code == 422  # Validation error
 
 
+@pytest.mark.unit
+def test_events_endpoint_after_id_pagination(client: TestClient):
+    """Test the /events endpoint only returns events older than after_id."""
+    response = client.get("/events?limit=10&after_id=100")
+
+    assert response.status_code in [200, 500]  # 500 if DB not available in test
+
+    if response.status_code == 200:
+        data = response.json()
+        assert isinstance(data, list)
+        assert all(event["id"] < 100 for event in data)
+
+
+@pytest.mark.unit
+def test_events_endpoint_validation_after_id(client: TestClient):
+    """Test the /events endpoint rejects after_id < 1."""
+    response = client.get("/events?after_id=0")
+
+    assert response.status_code == 422  # Validation error
+
+
 @pytest.mark.unit
 def test_pipeline_run_endpoint_structure(client: TestClient):
     """Test the /pipeline/run endpoint returns expected structure."""
@@ -96,6 +164,63 @@ def test_pipeline_run_endpoint_structure(client: TestClient):
         assert data["status"] == "queued"
 
 
+@pytest.mark.unit
+def test_metrics_endpoint_available(client: TestClient):
+    """Test the /metrics endpoint serves the Prometheus text format."""
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "http_requests_total" in response.text
+
+
+@pytest.mark.unit
+def test_middleware_response_headers(client: TestClient):
+    """Test security, CORS and timing headers are added by the middleware stack."""
+    response = client.get("/health", headers={"Origin": "https://example.com"})
+
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert response.headers["X-Frame-Options"] == "DENY"
+    assert response.headers["Access-Control-Allow-Origin"] == "https://example.com"
+    # Probe endpoints skip request logging/timing
+    assert "X-Process-Time" not in response.headers
+
+    response = client.get("/openapi.json")
+    assert "X-Process-Time" in response.headers
+
+
+@pytest.mark.unit
+def test_rate_limit_batches_redis_sync():
+    """Test the rate limiter counts locally and syncs hits to Redis in batches."""
+    from fastapi import FastAPI
+    from middleware import RateLimitMiddleware
+
+    calls = []
+
+    def fake_script(keys, args):
+        calls.append(args[1])
+        return sum(calls)
+
+    inner = FastAPI()
+
+    @inner.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    limiter = RateLimitMiddleware(inner, redis_url="redis://localhost:6379/0", requests_per_minute=12,
+                                  sync_every=5, sync_interval=3600)
+    limiter.redis_available = True
+    limiter.rate_limit_script = fake_script
+    test_client = TestClient(limiter)
+
+    statuses = [test_client.get("/ping").status_code for _ in range(14)]
+
+    # First hit syncs immediately, then every 5 local hits
+    assert calls == [1, 5, 5]
+    assert statuses[:12] == [200] * 12
+    assert statuses[12:] == [429, 429]
+
+
 @pytest.mark.unit
 def test_openapi_docs_available(client: TestClient):
     """Test that OpenAPI documentation is available."""
@@ -0,0 +1,26 @@
+"""
+Unit tests for the validated settings.
+"""
+import os
+
+import pytest
+
+from config import Settings
+
+ENV_EXAMPLE = os.path.join(os.path.dirname(__file__), "..", ".env.example")
+
+
+@pytest.mark.unit
+def test_settings_load_env_example():
+    """Test that every key of .env.example is a declared Settings field."""
+    settings = Settings(_env_file=ENV_EXAMPLE)
+
+    assert settings.video_encoder == "auto"
+    assert settings.db_behind_pgbouncer is False
+
+
+@pytest.mark.unit
+def test_settings_reject_unknown_video_encoder():
+    """Test that an unsupported VIDEO_ENCODER is rejected."""
+    with pytest.raises(ValueError):
+        Settings(_env_file=None, video_encoder="h265_magic")
@@ -0,0 +1,70 @@
+"""
+Unit tests for the buffered event writer.
+"""
+import pytest
+
+import db
+
+
+class FakeRawConnection:
+    """Minimal DB-API connection recording commits and rollbacks."""
+
+    def __init__(self):
+        self.committed = 0
+        self.rolled_back = 0
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def commit(self):
+        self.committed += 1
+
+    def rollback(self):
+        self.rolled_back += 1
+
+    def close(self):
+        pass
+
+
+@pytest.mark.unit
+def test_log_event_serializes_at_enqueue(monkeypatch):
+    """Test that payloads are encoded when queued, and bad ones fail at the caller."""
+    queued = []
+    monkeypatch.setattr(db, "_ensure_flush_thread", lambda: None)
+    monkeypatch.setattr(db._event_queue, "put", queued.append)
+
+    db.log_event("test_event", {1: "int key", "nested": {"a": 1}})
+    kind, payload, status = queued[0]
+    assert (kind, status) == ("test_event", "ok")
+    assert payload.dumps(payload.adapted) == '{"1":"int key","nested":{"a":1}}'
+
+    with pytest.raises(TypeError):
+        db.log_event("test_event", {"too_big": 2 ** 70})
+    assert len(queued) == 1
+
+
+@pytest.mark.unit
+def test_write_events_retries_rows_after_batch_failure(monkeypatch):
+    """Test that one bad row does not drop the other events of its batch."""
+    raw = FakeRawConnection()
+    written = []
+
+    def fake_execute_values(cur, sql, rows, page_size):
+        if any(row[0] == "bad" for row in rows):
+            raise ValueError("rejected row")
+        written.extend(rows)
+
+    monkeypatch.setattr(db.engine, "raw_connection", lambda: raw)
+    monkeypatch.setattr(db, "execute_values", fake_execute_values)
+
+    db._write_events([("a", "{}", "ok"), ("bad", "{}", "ok"), ("b", "{}", "ok")])
+
+    assert [row[0] for row in written] == ["a", "b"]
+    assert raw.committed == 2
+    assert raw.rolled_back == 2
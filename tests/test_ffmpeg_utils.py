@@ -0,0 +1,50 @@
+"""
+Unit tests for the ffmpeg stream-copy checks.
+"""
+import subprocess
+
+import pytest
+
+import ffmpeg_utils
+
+H264_STREAM = {
+    "codec_name": "h264",
+    "codec_tag_string": "avc1",
+    "profile": "High",
+    "level": "40",
+    "width": "1920",
+    "height": "1080",
+    "pix_fmt": "yuv420p",
+    "r_frame_rate": "30/1",
+    "time_base": "1/15360",
+    "extradata_hash": "SHA256:aaaa",
+}
+
+
+def _fake_ffprobe(streams):
+    """Return a subprocess.run stand-in printing the given stream per input path."""
+    def run(cmd, **kwargs):
+        # ffprobe prints fields in its own order, not the requested one
+        lines = [f"{key}={value}" for key, value in reversed(list(streams[cmd[-1]].items()))]
+        return subprocess.CompletedProcess(cmd, 0, stdout="\n".join(lines) + "\n", stderr="")
+    return run
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("field, value, expected", [
+    ("width", "1920", True),
+    ("profile", "Main", False),
+    ("level", "31", False),
+    ("extradata_hash", "SHA256:bbbb", False),
+    ("codec_tag_string", "avc3", False),
+])
+def test_can_stream_copy_compares_h264_parameters(tmp_path, monkeypatch, field, value, expected):
+    """Test that segments are only stream-copied when every H.264 parameter matches."""
+    first, second = tmp_path / "intro.mp4", tmp_path / "loop.mp4"
+    first.write_bytes(b"intro")
+    second.write_bytes(b"loop")
+    streams = {str(first): H264_STREAM, str(second): {**H264_STREAM, field: value}}
+    monkeypatch.setattr(ffmpeg_utils.subprocess, "run", _fake_ffprobe(streams))
+    ffmpeg_utils._probe_video_stream.cache_clear()
+
+    assert ffmpeg_utils._can_stream_copy(str(first), str(second)) is expected
@@ -12,41 +12,104 @@ from sqlalchemy.orm import sessionmaker
 import redis
 
 
+@pytest.fixture(scope="session")
+def engine():
+    """
+    Create the database engine once per test session.
+
+    Yields:
+        SQLAlchemy engine whose connection pool is shared by all tests
+    """
+    database_url = os.getenv("DATABASE_URL", "postgresql+psycopg2://lofi:lofi@db:5432/lofi")
+    engine = create_engine(database_url, pool_pre_ping=True, pool_size=5)
+
+    yield engine
+
+    engine.dispose()
+
+
 @pytest.fixture
-def db_session():
+def db_session(engine):
     """
-    Create a test database session.
+    Create a test database session inside a transaction that is rolled back.
+
+    The session joins an outer connection-level transaction: its commits only
+    release savepoints, and the rollback on teardown discards everything the
+    test wrote, so tests need no DELETE cleanup.
 
     Yields:
         SQLAlchemy session for testing
     """
-    database_url = os.getenv("DATABASE_URL", "postgresql+psycopg2://lofi:lofi@db:5432/lofi")
-    engine = create_engine(database_url)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    connection = engine.connect()
+    transaction = connection.begin()
+    SessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, bind=connection, join_transaction_mode="create_savepoint"
+    )
     session = SessionLocal()
 
     yield session
 
     session.close()
+    transaction.rollback()
+    connection.close()
+
+
+def insert_events(session, rows):
+    """
+    Insert events with a single multi-row INSERT and one commit.
+
+    Args:
+        session: SQLAlchemy session
+        rows: Dictionaries with kind, status and payload keys
+
+    Returns:
+        Ids of the inserted events, in row order
+    """
+    values = ", ".join(f"(:kind{i}, :status{i}, :payload{i})" for i in range(len(rows)))
+    params = {f"{key}{i}": row[key] for i, row in enumerate(rows) for key in ("kind", "status", "payload")}
+    result = session.execute(
+        text(f"INSERT INTO events (kind, status, payload) VALUES {values} RETURNING id"), params
+    )
+    ids = [row[0] for row in result]
+    session.commit()
+    return ids
+
+
+@pytest.fixture(scope="session")
+def redis_pool():
+    """
+    Create the Redis connection pool once per test session.
+
+    Yields:
+        Redis connection pool shared by all tests
+    """
+    redis_url = os.getenv("REDIS_URL", "redis://redis:6379/0")
+    pool = redis.ConnectionPool.from_url(redis_url)
+
+    yield pool
+
+    pool.disconnect()
 
 
 @pytest.fixture
-def redis_client():
+def redis_client(redis_pool):
     """
     Create a Redis client for testing.
 
     Yields:
-        Redis client instance
+        Redis client instance backed by the session pool
     """
-    redis_url = os.getenv("REDIS_URL", "redis://redis:6379/0")
-    client = redis.from_url(redis_url)
+    client = redis.Redis(connection_pool=redis_pool)
 
     yield client
 
-    # Cleanup test keys
-    test_keys = client.keys("test:*")
-    if test_keys:
-        client.delete(*test_keys)
+    # Cleanup test keys incrementally (SCAN) with non-blocking UNLINK batches
+    pipe = client.pipeline(transaction=False)
+    for i, key in enumerate(client.scan_iter(match="test:*", count=500), start=1):
+        pipe.unlink(key)
+        if i % 500 == 0:
+            pipe.execute()
+    pipe.execute()
 
 
 @pytest.mark.integration
@@ -80,17 +143,13 @@ def test_videos_table_exists(db_session):
 @pytest.mark.integration
 def test_insert_event(db_session):
     """Test inserting an event into the database."""
-    db_session.execute(
-        text(
-            "INSERT INTO events (kind, status, payload) VALUES (:kind, :status, :payload)"
-        ),
+    insert_events(db_session, [
         {
             "kind": "test_integration",
             "status": "ok",
             "payload": '{"test": true, "timestamp": "2024-01-01T00:00:00Z"}'
         }
-    )
-    db_session.commit()
+    ])
 
     # Verify insertion
     result = db_session.execute(
@@ -99,26 +158,18 @@ def test_insert_event(db_session):
     count = result.fetchone()[0]
     assert count >= 1
 
-    # Cleanup
-    db_session.execute(text("DELETE FROM events WHERE kind = 'test_integration'"))
-    db_session.commit()
-
 
 @pytest.mark.integration
 def test_query_events(db_session):
     """Test querying events from the database."""
     # Insert test event
-    db_session.execute(
-        text(
-            "INSERT INTO events (kind, status, payload) VALUES (:kind, :status, :payload)"
-        ),
+    insert_events(db_session, [
         {
             "kind": "test_query",
             "status": "ok",
             "payload": '{"action": "query_test"}'
         }
-    )
-    db_session.commit()
+    ])
 
     # Query
     result = db_session.execute(
@@ -130,10 +181,6 @@ def test_query_events(db_session):
     assert row[1] == "test_query"  # kind
     assert row[2] == "ok"  # status
 
-    # Cleanup
-    db_session.execute(text("DELETE FROM events WHERE kind = 'test_query'"))
-    db_session.commit()
-
 
 @pytest.mark.integration
 def test_redis_connection(redis_client):
@@ -147,16 +194,15 @@ def test_redis_set_get(redis_client):
     key = "test:simple_key"
     value = "test_value"
 
-    # Set value
-    redis_client.set(key, value)
+    # Set, get and clean up in a single round trip
+    with redis_client.pipeline(transaction=False) as pipe:
+        pipe.set(key, value)
+        pipe.get(key)
+        pipe.delete(key)
+        _, result, _ = pipe.execute()
 
-    # Get value
-    result = redis_client.get(key)
     assert result.decode('utf-8') == value
 
-    # Cleanup
-    redis_client.delete(key)
-
 
 @pytest.mark.integration
 def test_redis_expiration(redis_client):
@@ -180,21 +226,23 @@ def test_redis_hash(redis_client):
     """Test Redis hash operations."""
     key = "test:hash_key"
 
-    # Set hash fields
-    redis_client.hset(key, "field1", "value1")
-    redis_client.hset(key, "field2", "value2")
+    # Set, read and clean up the hash in a single round trip
+    with redis_client.pipeline(transaction=False) as pipe:
+        pipe.hset(key, "field1", "value1")
+        pipe.hset(key, "field2", "value2")
+        pipe.hget(key, "field1")
+        pipe.hget(key, "field2")
+        pipe.hgetall(key)
+        pipe.delete(key)
+        _, _, field1, field2, all_fields, _ = pipe.execute()
 
     # Get hash fields
-    assert redis_client.hget(key, "field1").decode('utf-8') == "value1"
-    assert redis_client.hget(key, "field2").decode('utf-8') == "value2"
+    assert field1.decode('utf-8') == "value1"
+    assert field2.decode('utf-8') == "value2"
 
     # Get all hash fields
-    all_fields = redis_client.hgetall(key)
     assert len(all_fields) == 2
 
-    # Cleanup
-    redis_client.delete(key)
-
 
 @pytest.mark.integration
 def test_health_endpoint_with_real_services(client):
@@ -217,26 +265,19 @@ def test_health_endpoint_with_real_services(client):
 @pytest.mark.slow
 def test_full_event_lifecycle(db_session):
     """Test complete event lifecycle: create, read, update, delete."""
-    # Create
-    db_session.execute(
+    # Create and read back the stored row in the same round trip
+    event_id, status = db_session.execute(
         text(
-            "INSERT INTO events (kind, status, payload) VALUES (:kind, :status, :payload) RETURNING id"
+            "INSERT INTO events (kind, status, payload) VALUES (:kind, :status, :payload) RETURNING id, status"
         ),
         {
             "kind": "test_lifecycle",
             "status": "pending",
             "payload": '{"step": 1}'
         }
-    )
+    ).one()
     db_session.commit()
-
-    # Read
-    result = db_session.execute(
-        text("SELECT id, status FROM events WHERE kind = 'test_lifecycle'")
-    )
-    row = result.fetchone()
-    event_id = row[0]
-    assert row[1] == "pending"
+    assert status == "pending"
 
     # Update
     db_session.execute(
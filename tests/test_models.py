@@ -4,26 +4,24 @@ Unit tests for SQLAlchemy ORM models.
 import pytest
 from datetime import datetime
 
+from models import Event, Video
+
 
 @pytest.mark.unit
 def test_event_model_imports():
     """Test that Event model can be imported."""
-    from models import Event
     assert Event is not None
 
 
 @pytest.mark.unit
 def test_video_model_imports():
     """Test that Video model can be imported."""
-    from models import Video
     assert Video is not None
 
 
 @pytest.mark.unit
 def test_event_model_attributes():
     """Test that Event model has expected attributes."""
-    from models import Event
-
     # Check table name
     assert Event.__tablename__ == "events"
 
@@ -38,8 +36,6 @@ def test_event_model_attributes():
 @pytest.mark.unit
 def test_video_model_attributes():
     """Test that Video model has expected attributes."""
-    from models import Video
-
     # Check table name
     assert Video.__tablename__ == "videos"
 
@@ -58,8 +54,6 @@ def test_video_model_attributes():
 @pytest.mark.unit
 def test_event_model_repr():
     """Test Event model __repr__ method."""
-    from models import Event
-
     # Create a mock event (not persisted to DB)
     event = Event()
     event.id = 123
@@ -75,8 +69,6 @@ def test_event_model_repr():
 @pytest.mark.unit
 def test_video_model_repr():
     """Test Video model __repr__ method."""
-    from models import Video
-
     # Create a mock video (not persisted to DB)
     video = Video()
     video.id = 456
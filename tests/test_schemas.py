@@ -4,12 +4,21 @@ Unit tests for Pydantic schemas.
 import pytest
 from datetime import datetime
 
+from pydantic import ValidationError
+
+from schemas import (
+    ErrorResponse,
+    EventResponse,
+    HealthResponse,
+    PipelineRunResponse,
+    VideoCreateRequest,
+    VideoResponse,
+)
+
 
 @pytest.mark.unit
 def test_health_response_schema():
     """Test HealthResponse schema validation."""
-    from schemas import HealthResponse
-
     data = {
         "status": "ok",
         "database": "ok",
@@ -26,8 +35,6 @@ def test_health_response_schema():
 @pytest.mark.unit
 def test_pipeline_run_response_schema():
     """Test PipelineRunResponse schema validation."""
-    from schemas import PipelineRunResponse
-
     data = {
         "task_id": "abc-123-def",
         "status": "queued"
@@ -41,8 +48,6 @@ def test_pipeline_run_response_schema():
 @pytest.mark.unit
 def test_event_response_schema():
     """Test EventResponse schema validation."""
-    from schemas import EventResponse
-
     data = {
         "id": 123,
         "created_at": datetime.utcnow(),
@@ -58,8 +63,6 @@ def test_event_response_schema():
 @pytest.mark.unit
 def test_video_create_request_validation():
     """Test VideoCreateRequest validation."""
-    from schemas import VideoCreateRequest
-
     # Valid data
     data = {
         "title": "Test Video",
@@ -76,9 +79,6 @@ def test_video_create_request_validation():
 @pytest.mark.unit
 def test_video_create_request_validation_title_required():
     """Test VideoCreateRequest requires title."""
-    from schemas import VideoCreateRequest
-    from pydantic import ValidationError
-
     # Missing title
     with pytest.raises(ValidationError):
         VideoCreateRequest(description="Test", tags=[])
@@ -87,9 +87,6 @@ def test_video_create_request_validation_title_required():
 @pytest.mark.unit
 def test_video_create_request_validation_title_min_length():
     """Test VideoCreateRequest title minimum length."""
-    from schemas import VideoCreateRequest
-    from pydantic import ValidationError
-
     # Empty title
     with pytest.raises(ValidationError):
         VideoCreateRequest(title="", description="Test")
@@ -98,8 +95,6 @@ def test_video_create_request_validation_title_min_length():
 @pytest.mark.unit
 def test_video_response_schema():
     """Test VideoResponse schema validation."""
-    from schemas import VideoResponse
-
     data = {
         "id": 456,
         "created_at": datetime.utcnow(),
@@ -121,8 +116,6 @@ def test_video_response_schema():
 @pytest.mark.unit
 def test_error_response_schema():
     """Test ErrorResponse schema validation."""
-    from schemas import ErrorResponse
-
     data = {
         "detail": "An error occurred",
         "error_code": "ERR_001"